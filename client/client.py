@@ -4,20 +4,77 @@ This client connects to a specified host and port, sends HTTP-like GET requests
 and prints the JSON response received from the server.
 
 Usage:
-    python client.py --port <port> [--host <host>] [--get <endpoint>] [--metrics]
+    python client.py --port <port> [--host <host>] [--get <endpoint>] [--get-many <endpoint> ...] [--metrics] [--quiet]
 
 Behavior:
 - If --metrics flag is provided, sends a METRICS request to the server.
 - If --get <endpoint> is provided, sends a GET request for the specified endpoint.
-- If neither --metrics nor --get is provided, prints an error message.
+- If --get-many <endpoint> ... is provided, sends all GET requests concurrently.
+- If none of --metrics, --get or --get-many is provided, prints an error message.
+- If --quiet is provided, prints the response as compact single-line JSON.
 - Handles connection errors gracefully by returning a JSON error response.
 """
 
 import socket
-import json
 import argparse
+import asyncio
 import time
 
+try:
+    import orjson
+
+    def json_dumps(obj, indent=False):
+        """Serialize obj to UTF-8 JSON bytes, compact or indented by two spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def json_dumps(obj, indent=False):
+        """Serialize obj to UTF-8 JSON bytes, matching orjson's compact and indented output formats."""
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    json_loads = json.loads
+
+
+def _recv_line(sock):
+    """
+    Reads a single newline-terminated line directly from a socket.
+
+    Parameters:
+        sock (socket.socket): The connected socket to read from.
+
+    Returns:
+        bytes: The line including its trailing newline, or whatever was received before
+               the server closed the connection (empty if nothing was received).
+
+    Behavior:
+        Accumulates recv() chunks in a bytearray until a newline arrives, avoiding the
+        buffered/text wrapper layers that socket.makefile() would allocate.
+    """
+    buf = bytearray()
+    while True:
+        chunk = sock.recv(4096)
+        if not chunk:
+            return bytes(buf)
+        buf += chunk
+        if chunk.find(b"\n") != -1:
+            return bytes(buf)
+
+
+def _connection_error():
+    """
+    Returns a new CLIENT_CONNECTION_ERROR response dictionary.
+
+    Behavior:
+        A fresh dictionary is built on each call because run() adds latency_ms to the response.
+    """
+    return {"status": "CLIENT_CONNECTION_ERROR", "data": None}
+
+
 def build_request(path):
     """
     Constructs a simple HTTP-like GET request string for the given path.
@@ -36,7 +93,7 @@ def build_request(path):
 
 def send_request(host, port, request_str):
     """
-    Sends a request string to the specified host and port using a TCP socket and returns the JSON response.
+    Sends a request string to the specified host and port using a TCP socket and returns the parsed JSON response.
 
     Parameters:
         host (str): The IP address or hostname of the server to connect to.
@@ -44,55 +101,116 @@ def send_request(host, port, request_str):
         request_str (str): The request string to send, expected to be newline-terminated.
 
     Returns:
-        dict or str: The parsed JSON response from the server as a dictionary if successful,
-                     or a JSON-formatted error string if a connection error occurs or no response is received.
+        dict: The response from the server, parsed once with json_loads, or a CLIENT_CONNECTION_ERROR
+              response if a connection error occurs or no response is received.
 
     Socket Behavior:
-        - Opens a TCP socket connection to the server.
+        - Opens a TCP socket connection to the server with Nagle's algorithm disabled.
         - Sends the encoded request string.
         - Reads a single line from the server, expecting a newline-terminated JSON string.
-        - Closes the socket and associated file object after communication.
+        - Closes the socket after communication.
 
     Error Handling:
-        - If the connection fails or no response is received, returns a JSON string indicating CLIENT_CONNECTION_ERROR.
+        - If the connection fails or no response is received, returns a response indicating CLIENT_CONNECTION_ERROR.
 
     Protocol Assumptions:
         - The server responds with a single line of JSON terminated by a newline character.
     """
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    f = None
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     try:
         try:
             s.connect((host, port))
         except Exception as e:
-            response = {
-                "status": "CLIENT_CONNECTION_ERROR",
-                "data": None
-            }
-            res = json.dumps(response) + '\n'
-            return res
-
-        f = s.makefile('r', encoding='utf-8', newline='\n')
+            return _connection_error()
+
         s.sendall(request_str.encode('utf-8'))
 
-        first_line = f.readline()
+        first_line = _recv_line(s)
 
         if first_line:
-            return first_line
+            return json_loads(first_line)
         else:
-            response = {
-                "status": "CLIENT_CONNECTION_ERROR",
-                "data": None
-            }
-            res = json.dumps(response) + '\n'
-            return res
+            return _connection_error()
     finally:
-        if f:
-            f.close()
         s.close()
 
 
+async def send_request_async(host, port, request_str):
+    """
+    Asynchronously sends a request string to the specified host and port and returns the parsed JSON response.
+
+    Parameters:
+        host (str): The IP address or hostname of the server to connect to.
+        port (int): The port number on which the server is listening.
+        request_str (str): The request string to send, expected to be newline-terminated.
+
+    Returns:
+        dict: The parsed response from the server, or a CLIENT_CONNECTION_ERROR response
+              if the connection fails or no response is received.
+
+    Behavior:
+        Same protocol as send_request, but awaits the connect and read so many requests can be
+        in flight on one event loop. Each request uses its own connection, since the server
+        answers one request per connection.
+    """
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        return _connection_error()
+
+    try:
+        writer.write(request_str.encode('utf-8'))
+        await writer.drain()
+        first_line = await reader.readline()
+    except OSError:
+        first_line = b''
+    finally:
+        writer.close()
+
+    if first_line:
+        return json_loads(first_line)
+    return _connection_error()
+
+
+async def send_many(host, port, paths):
+    """
+    Sends GET requests for several paths concurrently and returns their parsed responses.
+
+    Parameters:
+        host (str): The IP address or hostname of the server to connect to.
+        port (int): The port number on which the server is listening.
+        paths (list of str): The endpoint paths to request.
+
+    Returns:
+        list of dict: The parsed JSON responses, in the same order as paths.
+
+    Behavior:
+        All requests are started at once with asyncio.gather, so the batch completes in roughly
+        the time of the slowest request instead of the sum of all of them.
+    """
+    return await asyncio.gather(*(send_request_async(host, port, build_request(path)) for path in paths))
+
+
+def print_response(res, quiet=False):
+    """
+    Prints a response dictionary as JSON.
+
+    Parameters:
+        res (dict): The response to print.
+        quiet (bool): If True, prints compact single-line JSON instead of indented output.
+
+    Behavior:
+        Serializes with json_dumps (orjson when installed) in both modes; the compact form skips indentation entirely,
+        which keeps output cheap when the client runs inside a benchmark loop.
+    """
+    if quiet:
+        print(json_dumps(res).decode('utf-8'))
+    else:
+        print(json_dumps(res, indent=True).decode('utf-8'))
+
+
 def run(args):
     """
     Runs the client logic based on parsed command-line arguments.
@@ -102,16 +220,27 @@ def run(args):
 
     Behavior:
         - If --metrics flag is set, sends a "METRICS\n" request and prints the JSON response.
+        - If --get-many <endpoint> ... is provided, sends all GET requests concurrently and prints the responses
+          together with the latency of the whole batch.
         - If --get <endpoint> is provided, sends a GET request for the specified endpoint and prints the JSON response.
-        - If neither --metrics nor --get is provided, prints an error message indicating that GET endpoint must be provided.
+        - If none of --metrics, --get or --get-many is provided, prints an error message indicating that GET endpoint must be provided.
+        - Responses are printed indented, or as compact single-line JSON if --quiet is set.
     """
     if args.metrics:
         request_str = "METRICS\n"
         start_time = time.time()
-        res = json.loads(send_request(args.host, args.port, request_str))
+        res = send_request(args.host, args.port, request_str)
         end_time = time.time()
         res["latency_ms"] = (end_time - start_time) * 1000
-        print(json.dumps(res, indent=4))
+        print_response(res, args.quiet)
+        return
+
+    if args.get_many:
+        start_time = time.time()
+        responses = asyncio.run(send_many(args.host, args.port, args.get_many))
+        end_time = time.time()
+        res = {"responses": responses, "latency_ms": (end_time - start_time) * 1000}
+        print_response(res, args.quiet)
         return
 
     if not args.get:
@@ -120,10 +249,10 @@ def run(args):
     url = args.get
     request_str = build_request(url)
     start_time = time.time()
-    res = json.loads(send_request(args.host, args.port, request_str))
+    res = send_request(args.host, args.port, request_str)
     end_time = time.time()
     res["latency_ms"] = (end_time - start_time) * 1000
-    print(json.dumps(res, indent=4))
+    print_response(res, args.quiet)
 
 
 if __name__ == "__main__":
@@ -134,10 +263,13 @@ if __name__ == "__main__":
         --host (str): Hostname or IP address of the server (default: 127.0.0.1).
         --port (int): Port number of the server (required).
         --get (str): Endpoint path for GET request.
+        --get-many (list of str): Endpoint paths to GET concurrently.
         --metrics (flag): If set, sends a METRICS request instead of GET.
+        --quiet (flag): If set, prints compact single-line JSON.
 
     Example usage:
         python client.py --port 8080 --get /status
+        python client.py --port 8080 --get-many article/1 article/2 article/3
         python client.py --host 192.168.1.10 --port 8080 --metrics
     """
     parser = argparse.ArgumentParser()
@@ -164,5 +296,16 @@ if __name__ == "__main__":
         type=str,
     )
 
+    parser.add_argument(
+        "--get-many",
+        type=str,
+        nargs="+",
+    )
+
+    parser.add_argument(
+        "--quiet",
+        action="store_true"
+    )
+
     args = parser.parse_args()
     run(args)
\ No newline at end of file
@@ -10,13 +10,90 @@ a centralized entry point for clients, forwarding requests to appropriate proxy
 and aggregating metrics for monitoring purposes.
 """
 
+import os
+import signal
 import socket
 import threading
 import argparse
-import json
 import time
+import queue
+import collections
+import selectors
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from node_manager import NodeManager
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads, JSONDecodeError
+except ImportError:
+    import json
+    from json import JSONDecodeError
+
+    def json_dumps(obj):
+        """Serialize obj to compact UTF-8 JSON bytes, matching orjson's output format."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    json_loads = json.loads
+
+MAX_REQUEST_BYTES = 4096
+RESPONSE_CACHE_MAXSIZE = 1024
+# Proxies tried per client request; a failed or timed-out forward fails over to the next pick.
+FORWARD_ATTEMPTS = 2
+
+# Error responses are constant, so they are serialized once at import time.
+PROXY_UNREACHABLE_BYTES = json_dumps({"status": "PROXY_UNREACHABLE", "data": None}) + b"\n"
+PROXY_ERROR_BYTES = json_dumps({"status": "PROXY_ERROR", "data": None}) + b"\n"
+# Envelope for PROXY_UNREACHABLE responses that carry an error message as data.
+PROXY_UNREACHABLE_PREFIX = b'{"status":"PROXY_UNREACHABLE","data":'
+INVALID_PROXY_RESPONSE_BYTES = PROXY_UNREACHABLE_PREFIX + json_dumps("invalid response from proxy") + b"}\n"
+# Opening of a successful proxy response; only these are stored in the response cache.
+OK_RESPONSE_PREFIX = b'{"status":"OK"'
+
+# Response for a request that exceeds MAX_REQUEST_BYTES without a newline.
+REQUEST_TOO_LARGE_BYTES = json_dumps(
+    {"status": "BAD_REQUEST", "data": f"request exceeds {MAX_REQUEST_BYTES} bytes"}
+) + b"\n"
+
+
+def _raise_system_exit(signum, frame):
+    """
+    Signal handler that turns SIGTERM into SystemExit so the accept loop can shut down cleanly.
+    """
+    raise SystemExit(0)
+
+
+def _recv_line(sock):
+    """
+    Read a single newline-terminated line from a socket.
+
+    Parameters:
+    - sock (socket.socket): Connected socket to read from.
+
+    Returns:
+    - bytes: The line including its trailing newline, or whatever was received
+      before the peer closed the connection (empty if nothing was received).
+
+    Behavior:
+    - Reads directly from the raw socket so the connection can be reused afterwards.
+      The protocol sends exactly one response line per request, so no bytes follow
+      the newline.
+    - A line that arrives in a single recv is returned as is; only longer lines are
+      accumulated in a bytearray.
+    """
+    chunk = sock.recv(65536)
+    if not chunk or chunk.find(b"\n") != -1:
+        return chunk
+    
+    buf = bytearray(chunk)
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return bytes(buf)
+        buf += chunk
+        if chunk.find(b"\n") != -1:
+            return bytes(buf)
+
 
 class LoadBalancer:
     """
@@ -34,7 +111,8 @@ class LoadBalancer:
     - Communicates with proxy nodes over TCP sockets to forward requests and retrieve metrics.
     """
 
-    def __init__(self, host, port, proxy_list, strategy):
+    def __init__(self, host, port, proxy_list, strategy, max_keepalive=100, cacheable_resources=(), response_ttl=0.5,
+                 forward_timeout=5.0):
         """
         Initialize the LoadBalancer instance.
 
@@ -43,165 +121,632 @@ class LoadBalancer:
         - port (int): The port number where the load balancer listens.
         - proxy_list (list of tuples): List of proxy nodes as (host, port) tuples.
         - strategy (str): Load balancing strategy to use ("round_robin" or "least_loaded").
+        - max_keepalive (int): Maximum number of idle connections kept open per proxy node.
+        - cacheable_resources (iterable of str): Resources (the part of a GET path before the
+          first "/") whose responses may be served from the response cache. Empty disables it.
+        - response_ttl (float): Seconds a cached GET response stays valid.
+        - forward_timeout (float): Seconds a forwarded request may wait on a proxy for each
+          socket operation, so a proxy that accepts but never replies cannot pin a worker.
 
         Behavior:
         - Sets up internal structures for proxy management and metrics tracking.
+        - Creates an empty keep-alive connection pool for each proxy node.
         - Initializes a NodeManager instance for health monitoring of proxies.
+        - Binds pick_proxy to the picker for the chosen strategy (_pick_round_robin or
+          _pick_least_loaded), so proxy selection does not compare strategy names per request.
         - Starts a background thread to periodically fetch metrics from proxies.
 
         Side Effects:
         - Starts a daemon thread for metrics collection.
+        - Creates a bounded thread pool for routing and forwarding client requests.
+        - Creates a selector used by the metrics thread to poll all proxies concurrently.
+
+        Error Handling:
+        - Raises ValueError if strategy is not "round_robin" or "least_loaded".
         """
         self.host = host
         self.port = port
         self.proxy_list = proxy_list
+        self.forward_timeout = forward_timeout
         
         self.node_manager = NodeManager(proxy_list)
         self.proxy_stats = {}
+        self.pools = {}
         for proxy_host, proxy_port in proxy_list:
             self.proxy_stats[(proxy_host, proxy_port)] = None
+            self.pools[(proxy_host, proxy_port)] = queue.LifoQueue(maxsize=max_keepalive)
             
         self.current_index = 0
+        # next() on itertools.count is atomic under the GIL, unlike "+= 1" on an attribute.
+        self._rr_counter = itertools.count(1)
         self.strategy = strategy
         
+        # pick_proxy is bound to the strategy's picker once, instead of branching per request.
+        if strategy == "round_robin":
+            self.pick_proxy = self._pick_round_robin
+        elif strategy == "least_loaded":
+            self.pick_proxy = self._pick_least_loaded
+        else:
+            raise ValueError(f"{strategy} is not a supported strategy")
+        
+        self._rr_nodes = None
+        self._rr_iter = None
+        
+        # Routing state indexed by position in proxy_list, refreshed by metrics_loop.
+        self._loads = [0] * len(proxy_list)
+        self._heap_lock = threading.Lock()
+        self._rebuild_load_heap()
+        
+        self._metrics_prefix = b'{"status":"OK","data":{"strategy":' + json_dumps(strategy) + b',"current_index":'
+        self._metrics_proxy_prefixes = [
+            json_dumps(f"{proxy_host}:{proxy_port}") + b':{"healthy":' for proxy_host, proxy_port in proxy_list
+        ]
+        self._metrics_cache = None
+        self._metrics_lock = threading.Lock()
+        
+        self.cacheable_resources = frozenset(cacheable_resources)
+        self.response_ttl = response_ttl
+        self._response_cache = {}
+        self._response_cache_lock = threading.Lock()
+        
+        # Responses finished by worker threads, waiting for the event loop to write them.
+        self._completed = collections.deque()
+        self._wakeup = None
+        
+        self.client_pool = ThreadPoolExecutor(max_workers=max(32, (os.cpu_count() or 1) * 8), thread_name_prefix="lb")
+        self._metrics_selector = selectors.DefaultSelector()
         self.metrics_thread = threading.Thread(target=self.metrics_loop, daemon=True)
         self.metrics_thread.start()
 
 
-    def start_server(self):
+    def start_server(self, reuse_port=False):
         """
         Start the load balancer server to accept incoming client connections.
 
+        Parameters:
+        - reuse_port (bool): Whether to set SO_REUSEPORT, so several load balancer worker
+          processes can share the port. Off by default, so a second load balancer started on
+          a port already in use fails instead of silently splitting traffic with the first.
+
         Behavior:
-        - Creates a TCP socket bound to the configured host and port.
-        - Listens for incoming client connections.
-        - For each accepted connection, spawns a new thread to handle the client request.
+        - Creates a non-blocking TCP socket bound to the configured host and port.
+        - Sets SO_REUSEADDR so a restart does not fail on connections left in TIME_WAIT.
+        - Sets SO_REUSEPORT if reuse_port is True.
+        - Listens for incoming client connections with the largest backlog the system allows.
+        - Runs an event loop on a selector (epoll on Linux, kqueue on BSD/macOS) that accepts
+          connections, reads each request until its newline, and writes each response, so
+          no thread ever blocks on a client socket.
+        - Hands each complete request to the client thread pool, which routes and forwards it;
+          the worker wakes the event loop through a socket pair once the response is ready.
+          METRICS requests are answered on the event loop itself.
+        - On SIGTERM, stops accepting, waits for in-flight requests and delivers their
+          responses before returning.
 
         Side Effects:
-        - Runs indefinitely, accepting and handling client connections concurrently.
+        - Runs until SIGTERM, handling client connections concurrently.
+        - Installs a SIGTERM handler when called from the main thread.
 
         Error Handling:
-        - Exceptions during socket operations are not explicitly caught here and will propagate.
+        - Errors on an individual client socket close that connection only.
+        - Exceptions while setting up the listening socket propagate.
         """
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, _raise_system_exit)
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s, selectors.DefaultSelector() as sel:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             s.bind((self.host, self.port))
-            s.listen(5)
+            s.listen(socket.SOMAXCONN)
+            s.setblocking(False)
             
-            while True:
-                
-                conn, add = s.accept()
-                
-                thread1 = threading.Thread(target=self.handle_client, args = (conn, add))
-                thread1.start()
+            wakeup_r, self._wakeup = socket.socketpair()
+            wakeup_r.setblocking(False)
+            self._wakeup.setblocking(False)
+            sel.register(s, selectors.EVENT_READ)
+            sel.register(wakeup_r, selectors.EVENT_READ)
+            
+            try:
+                while True:
+                    for key, mask in sel.select():
+                        sock = key.fileobj
+                        if sock is s:
+                            self._accept_clients(sel, s)
+                        elif sock is wakeup_r:
+                            self._drain_completed(sel, wakeup_r)
+                        elif mask & selectors.EVENT_READ:
+                            self._read_request(sel, sock, key.data)
+                        else:
+                            self._write_response(sel, sock, key.data)
+            except SystemExit:
+                pass
+            finally:
+                self.client_pool.shutdown(wait=True)
+                self._close_clients(sel, s, wakeup_r)
 
 
-    def handle_client(self, conn, addr):
+    def _accept_clients(self, sel, listener):
         """
-        Handle an individual client connection.
+        Accept every pending connection on the listening socket.
+
+        Behavior:
+        - Disables Nagle's algorithm on each connection, makes it non-blocking and
+          registers it for reading with an empty request buffer.
+        """
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                print(f"[AcceptError] {e}")
+                return
+            
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setblocking(False)
+            sel.register(conn, selectors.EVENT_READ, bytearray())
+
+
+    def _read_request(self, sel, conn, buf):
+        """
+        Read available bytes of a client request and dispatch it once it is complete.
 
         Parameters:
-        - conn (socket.socket): The socket connection to the client.
-        - addr (tuple): The client address.
+        - sel (selectors.BaseSelector): The event loop selector.
+        - conn (socket.socket): The readable client connection.
+        - buf (bytearray): Bytes of the request received so far.
+
+        Behavior:
+        - Once a newline arrives, stops watching the connection and dispatches the request
+          line with _dispatch_request. A request that arrives whole in one recv is
+          dispatched as is, without going through the buffer.
+        - If the client closes its side early, dispatches whatever was received, or closes
+          the connection if nothing was.
+
+        Error Handling:
+        - If MAX_REQUEST_BYTES are received without a newline, replies with a BAD_REQUEST response.
+        """
+        try:
+            chunk = conn.recv(MAX_REQUEST_BYTES - len(buf))
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            chunk = b""
+        
+        if not chunk:
+            sel.unregister(conn)
+            if buf:
+                self._dispatch_request(sel, conn, bytes(buf))
+            else:
+                conn.close()
+            return
+        
+        if not buf and chunk.find(b"\n") == len(chunk) - 1:
+            # The usual case: the whole request line arrived in one segment.
+            sel.unregister(conn)
+            self._dispatch_request(sel, conn, chunk)
+            return
+        
+        offset = len(buf)
+        buf += chunk
+        newline = buf.find(b"\n", offset)
+        if newline != -1:
+            sel.unregister(conn)
+            self._dispatch_request(sel, conn, bytes(buf[:newline + 1]))
+        elif len(buf) >= MAX_REQUEST_BYTES:
+            sel.unregister(conn)
+            self._start_response(sel, conn, REQUEST_TOO_LARGE_BYTES)
+
+
+    def _dispatch_request(self, sel, conn, request):
+        """
+        Answer a complete request line, on the event loop or on the client thread pool.
+
+        Parameters:
+        - sel (selectors.BaseSelector): The event loop selector.
+        - conn (socket.socket): The client connection, no longer registered with sel.
+        - request (bytes): The request line received from the client.
+
+        Behavior:
+        - METRICS never touches a proxy, so it is answered right here on the event loop.
+          The load balancer therefore stays observable even when every pool worker is busy
+          forwarding to slow proxies.
+        - Every other request is submitted to the client thread pool.
+        """
+        if request.strip() == b"METRICS":
+            self._start_response(sel, conn, self._metrics_response())
+        else:
+            self.client_pool.submit(self._serve_request, conn, request)
+
+
+    def _serve_request(self, conn, request):
+        """
+        Worker task: build the response for one request and pass it back to the event loop.
+
+        Parameters:
+        - conn (socket.socket): The client connection the response belongs to.
+        - request (bytes): The request line received from the client.
+
+        Concurrency:
+        - Runs on the client thread pool; the socket is only written by the event loop thread.
+
+        Error Handling:
+        - Unexpected errors are logged and answered with a PROXY_ERROR response so the
+          connection is never left open without a reply.
+        """
+        try:
+            response = self.handle_request(request)
+        except Exception as e:
+            print(f"[HandleRequestError] {e}")
+            response = PROXY_ERROR_BYTES
+        
+        self._completed.append((conn, response))
+        try:
+            self._wakeup.send(b"\0")
+        except OSError:
+            # The socket pair is full, so a wakeup is already pending, or the loop has stopped
+            # and will flush self._completed itself.
+            pass
+
+
+    def _drain_completed(self, sel, wakeup_r):
+        """
+        Start writing every response finished by the worker threads.
+        """
+        try:
+            while wakeup_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        
+        completed = self._completed
+        while completed:
+            conn, response = completed.popleft()
+            self._start_response(sel, conn, response)
+
+
+    def _start_response(self, sel, conn, response):
+        """
+        Write a response to a client, finishing it from the event loop if the socket is full.
+
+        Behavior:
+        - Most responses fit in the socket buffer, so they are sent immediately and the
+          connection is closed. Otherwise the connection is registered for writing with
+          the unsent remainder.
+        """
+        try:
+            sent = conn.send(response)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            conn.close()
+            return
+        
+        if sent == len(response):
+            conn.close()
+        else:
+            sel.register(conn, selectors.EVENT_WRITE, memoryview(response)[sent:])
+
+
+    def _write_response(self, sel, conn, remaining):
+        """
+        Continue writing a response whose first send was partial.
+
+        Parameters:
+        - sel (selectors.BaseSelector): The event loop selector.
+        - conn (socket.socket): The writable client connection.
+        - remaining (memoryview): The part of the response not yet sent.
+        """
+        try:
+            sent = conn.send(remaining)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            sent = len(remaining)
+        
+        if sent == len(remaining):
+            sel.unregister(conn)
+            conn.close()
+        else:
+            sel.modify(conn, selectors.EVENT_WRITE, remaining[sent:])
+
+
+    def _close_clients(self, sel, listener, wakeup_r):
+        """
+        Deliver pending responses and close every client connection when the server stops.
+
+        Behavior:
+        - Called after the client thread pool has finished, so every dispatched request
+          has its response in self._completed or in a registered write.
+        - Sends the remaining responses in blocking mode, then closes all connections,
+          including ones whose request was never completed.
+        """
+        pending = list(self._completed)
+        self._completed.clear()
+        for key in list(sel.get_map().values()):
+            sock = key.fileobj
+            if sock is listener:
+                continue
+            sel.unregister(sock)
+            if isinstance(key.data, memoryview):
+                pending.append((sock, key.data))
+            elif sock is not wakeup_r:
+                sock.close()
+        
+        for conn, response in pending:
+            try:
+                conn.setblocking(True)
+                conn.sendall(response)
+            except OSError:
+                pass
+            finally:
+                conn.close()
+        
+        wakeup_r.close()
+        self._wakeup.close()
+
+
+    def handle_request(self, data):
+        """
+        Build the response for one client request.
+
+        Parameters:
+        - data (bytes): The request line received from the client.
+
+        Returns:
+        - bytes: The newline-terminated JSON response to send back to the client.
 
         Behavior:
-        - Receives data from the client.
         - If the client requests "METRICS", returns the current load balancer and proxy metrics.
+          The per-proxy section is serialized once per metrics refresh and reused until the
+          next one, so health changes between refreshes show up at the next refresh.
         - Otherwise, selects a proxy node based on the strategy and forwards the client's request.
-        - Sends the response from the proxy back to the client.
-        - Handles proxy unreachability by sending appropriate error responses.
+          If the proxy cannot be reached, times out or answers with garbage, the request is
+          forwarded to the next pick, up to FORWARD_ATTEMPTS proxies in total.
+        - Returns the response from the proxy. For cacheable GETs, only OK responses are
+          stored, so a transient origin or proxy failure is not replayed to later clients.
+        - Handles proxy unreachability by returning appropriate error responses.
 
         Side Effects:
         - May mark proxy nodes as healthy or unhealthy based on communication success.
-        - Sends data back to the client over the socket.
 
         Error Handling:
-        - If no data is received, returns immediately.
-        - If forwarding fails, sends error JSON responses to client.
+        - If forwarding fails, returns error JSON responses.
         """
-        with conn:
-            data = conn.recv(1024)
-            
-            if not data: return
-            
-            decoded_data = data.decode('utf-8')
-            
-            if decoded_data.strip() == "METRICS":
-                
-                res = {}
-                res["status"] = "OK"
-                data = {}
-                data["strategy"] = self.strategy
-                data["current_index"] = self.current_index
-                data["proxies"] = {}
-                
-                for proxy_host, proxy_port in self.proxy_list:
-                    proxy_str = f"{proxy_host}:{proxy_port}"
-                    proxy_stat = {}
-                    proxy_stat["healthy"] = self.node_manager.is_healthy(proxy_host, proxy_port)
-                    proxy_stat["metrics"] = self.proxy_stats[(proxy_host, proxy_port)]
-                    data["proxies"][proxy_str] = proxy_stat 
-                res["data"] = data
-                
-                conn.sendall((json.dumps(res) + "\n").encode('utf-8'))
-                return 
-            
-            decoded_data = decoded_data.strip() + "\n"
-            
+        decoded_data = data.decode('utf-8')
+        
+        if decoded_data.strip() == "METRICS":
+            return self._metrics_response()
+        
+        decoded_data = decoded_data.strip() + "\n"
+        
+        cache_key = self._response_cache_key(decoded_data)
+        if cache_key is not None:
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+        
+        for _ in range(FORWARD_ATTEMPTS):
             proxy = self.pick_proxy()
             
-            if proxy is not None:
-                proxy_host, proxy_port = proxy
+            if proxy is None:
+                return PROXY_ERROR_BYTES
             
-                res = self.forward_request(proxy_host, proxy_port, decoded_data)
-                
-                if res:
-                    conn.sendall(res.encode('utf-8'))
-                    return
-                else:
-                    response = {
-                        "status": "PROXY_UNREACHABLE", 
-                        "data": None
-                    }
-                    conn.sendall((json.dumps(response) + "\n").encode('utf-8'))
-            else:
-                response = {
-                    "status": "PROXY_ERROR", 
-                    "data": None
-                }
-                conn.sendall((json.dumps(response) + "\n").encode('utf-8'))
+            proxy_host, proxy_port = proxy
+            res = self.forward_request(proxy_host, proxy_port, decoded_data)
+            
+            if not res:
+                return PROXY_UNREACHABLE_BYTES
+            if not res.startswith(PROXY_UNREACHABLE_PREFIX):
+                break
+        
+        if cache_key is not None and res.startswith(OK_RESPONSE_PREFIX):
+            self._store_response(cache_key, res)
+        return res
 
 
-    def pick_proxy(self):
+    def _metrics_response(self):
         """
-        Select a proxy node based on the configured load balancing strategy.
+        Build the METRICS response from the latest polled proxy metrics.
+
+        Returns:
+        - bytes: The newline-terminated JSON response.
+
+        Behavior:
+        - The per-proxy section is serialized once per metrics refresh and reused until the
+          next one; only the current index is encoded per call.
+        """
+        with self._metrics_lock:
+            if self._metrics_cache is None:
+                self._metrics_cache = self._encode_proxy_metrics()
+            proxies_tail = self._metrics_cache
+        
+        return b"".join([self._metrics_prefix, str(self.current_index).encode('utf-8'), proxies_tail])
+
+
+    def _response_cache_key(self, request):
+        """
+        Return the response cache key for a request, or None if it must not be cached.
+
+        Parameters:
+        - request (str): The normalized, newline-terminated request line.
+
+        Behavior:
+        - Only GET requests are idempotent, so only they are eligible.
+        - The resource (the path up to the first "/") must be in self.cacheable_resources.
+        - The request line itself is the key, since it fully determines the response.
+        """
+        if not self.cacheable_resources or not request.startswith("GET "):
+            return None
+        
+        resource = request[4:].split("/", 1)[0].strip()
+        if resource not in self.cacheable_resources:
+            return None
+        return request
+
+
+    def _get_cached_response(self, key):
+        """
+        Return the cached response bytes for key, or None if absent or expired.
+
+        Side Effects:
+        - Removes the entry if it has expired.
+
+        Concurrency:
+        - Guarded by self._response_cache_lock.
+        """
+        now = time.monotonic()
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= now:
+                del self._response_cache[key]
+                return None
+            return response
+
+
+    def _store_response(self, key, response):
+        """
+        Cache a proxy response for self.response_ttl seconds.
+
+        Parameters:
+        - key (str): The key returned by _response_cache_key.
+        - response (bytes): The raw response line forwarded to the client.
+
+        Behavior:
+        - When RESPONSE_CACHE_MAXSIZE is reached, expired entries are dropped first; if the
+          cache is still full, the oldest inserted entry is evicted.
+
+        Concurrency:
+        - Guarded by self._response_cache_lock.
+        """
+        now = time.monotonic()
+        with self._response_cache_lock:
+            cache = self._response_cache
+            if key not in cache and len(cache) >= RESPONSE_CACHE_MAXSIZE:
+                for stale in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                    del cache[stale]
+                if len(cache) >= RESPONSE_CACHE_MAXSIZE:
+                    del cache[next(iter(cache))]
+            cache[key] = (now + self.response_ttl, response)
+
+
+    def _encode_proxy_metrics(self):
+        """
+        Serialize the per-proxy part of the METRICS response.
+
+        Returns:
+        - bytes: The ',"proxies":{...}}}' tail of the METRICS response, newline-terminated.
+          Prepending self._metrics_prefix and the current index yields the full response.
+
+        Behavior:
+        - Reports each proxy's health and the metrics from the latest polling round.
+        - The schema is fixed, so the output is stitched from per-proxy byte templates built
+          in __init__; only the health flag and each proxy's metrics dict are encoded here.
+        """
+        parts = [b',"proxies":{']
+        for i, (proxy_host, proxy_port) in enumerate(self.proxy_list):
+            if i:
+                parts.append(b',')
+            parts.append(self._metrics_proxy_prefixes[i])
+            parts.append(b'true' if self.node_manager.is_healthy(proxy_host, proxy_port) else b'false')
+            parts.append(b',"metrics":')
+            parts.append(json_dumps(self.proxy_stats[(proxy_host, proxy_port)]))
+            parts.append(b'}')
+        parts.append(b'}}}\n')
+        
+        return b''.join(parts)
+
+
+    def _pick_round_robin(self):
+        """
+        Select the next proxy node in round robin order.
 
         Returns:
         - tuple: (host, port) of the selected proxy node.
-        - None: if no proxies are available.
 
         Behavior:
-        - Filters to healthy proxies if any exist; otherwise uses all proxies.
-        - If strategy is "round_robin", selects proxies in cyclic order.
-        - If strategy is "least_loaded", selects the proxy with the fewest total requests.
+        - Cycles through the node manager's healthy snapshot (all proxies if none are healthy).
+          The cycle iterator is rebuilt only when the snapshot object changes, i.e. when a
+          proxy's health flips.
 
         Side Effects:
-        - Updates the current index counter for round robin strategy.
+        - Updates the current index counter from self._rr_counter, so concurrent picks never
+          lose an increment.
+        """
+        healthy_proxies = self.node_manager.get_healthy_nodes()
+        if healthy_proxies is not self._rr_nodes:
+            self._rr_iter = itertools.cycle(tuple(healthy_proxies) or tuple(self.proxy_list))
+            self._rr_nodes = healthy_proxies
+        self.current_index = next(self._rr_counter)
+        return next(self._rr_iter)
 
-        Error Handling:
-        - Assumes proxy_stats entries may be None and treats them as zero load.
+
+    def _pick_least_loaded(self):
+        """
+        Select the proxy node with the lowest estimated load.
+
+        Returns:
+        - tuple: (host, port) of the selected proxy node.
+
+        Behavior:
+        - Takes the proxy with the lowest estimated load from the load heap, which holds the
+          currently healthy proxies. The estimate is bumped by one on every pick so traffic
+          spreads out between refreshes instead of piling onto a single proxy.
+        - Like the round robin cycle, the heap is rebuilt when the healthy snapshot object
+          changes, so a proxy that fails between metrics refreshes stops receiving traffic
+          right away.
+
+        Side Effects:
+        - Updates the load estimate in the load heap.
+        """
+        if self.node_manager.get_healthy_nodes() is not self._heap_nodes:
+            self._rebuild_load_heap(keep_estimates=True)
+        with self._heap_lock:
+            load, idx = self._load_heap[0]
+            heapq.heapreplace(self._load_heap, (load + 1, idx))
+        return self.proxy_list[idx]
+
+
+    def _rebuild_load_heap(self, keep_estimates=False):
+        """
+        Rebuild the least-loaded heap for the current set of healthy proxies.
+
+        Parameters:
+        - keep_estimates (bool): If True, proxies already in the heap keep their current
+          load estimate; used when only health changed. Otherwise every entry is reset to
+          the latest metrics.
+
+        Behavior:
+        - Creates one (load, index) entry per healthy proxy, where index is the proxy's
+          position in proxy_list and load comes from the index-aligned self._loads array.
+        - Uses every proxy if none are healthy, as the healthy snapshot does.
+        - Heapifies the entries and swaps them in as the new load heap, remembering the
+          snapshot it was built from.
+
+        Side Effects:
+        - Replaces self._load_heap and self._heap_nodes under the heap lock.
         """
         healthy_proxies = self.node_manager.get_healthy_nodes()
-        if not healthy_proxies:
-            healthy_proxies = self.proxy_list
-        if self.strategy == "round_robin":
-            idx = self.current_index % len(healthy_proxies)
-            proxy = healthy_proxies[idx]
-            self.current_index += 1
-            return proxy
+        loads = self._loads
+        if keep_estimates:
+            with self._heap_lock:
+                estimates = {idx: load for load, idx in self._load_heap}
+        else:
+            estimates = {}
+        
+        heap = [
+            (estimates.get(idx, loads[idx]), idx)
+            for idx, proxy in enumerate(self.proxy_list) if proxy in healthy_proxies
+        ]
+        heapq.heapify(heap)
         
-        elif self.strategy == "least_loaded":
-            return min(healthy_proxies, 
-                       key = lambda client :  self.proxy_stats[client]["total_requests"] if self.proxy_stats[client] else 0)
+        with self._heap_lock:
+            self._load_heap = heap
+            self._heap_nodes = healthy_proxies
 
 
     def forward_request(self, proxy_host, proxy_port, raw_request):
@@ -214,64 +759,187 @@ class LoadBalancer:
         - raw_request (str): The raw request string to forward.
 
         Returns:
-        - str: JSON-formatted response string from the proxy node, including newline.
-        - None: If the proxy is unreachable or response invalid.
+        - bytes: JSON-formatted response line from the proxy node, including newline.
+          If the proxy is unreachable or the response is invalid, a PROXY_UNREACHABLE
+          error line is returned instead.
 
         Behavior:
-        - Establishes a TCP connection to the proxy node.
-        - Sends the raw request.
-        - Reads a single line response and attempts to parse it as JSON.
-        - Marks the proxy node as healthy if response is valid.
+        - Borrows a pooled keep-alive connection to the proxy node, or opens a new one.
+        - Sends the raw request, waiting at most forward_timeout seconds for each connect,
+          send and receive, so a hung proxy fails the request instead of pinning the worker.
+        - Reads a single line response and checks that it looks like a JSON status object
+          (starts with "{", ends with "}" and contains a "status" key). The line is relayed
+          verbatim, so it is not parsed; the client does that.
+        - Marks the proxy node as healthy if response is valid and returns the connection to the pool.
         - Marks the proxy node as unhealthy if connection or response fails.
 
         Side Effects:
         - Updates node health status via NodeManager.
-        - Opens and closes socket connections.
+        - Opens, reuses, and closes socket connections.
 
         Error Handling:
-        - Catches connection errors and JSON parsing errors.
-        - Returns error JSON strings on failure.
+        - Catches connection errors and malformed responses.
+        - Returns error JSON lines on failure.
         """
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        f = None
-        
+        node_manager = self.node_manager
         try:
+            s, first_line = self._exchange(
+                proxy_host, proxy_port, raw_request.encode('utf-8'), self.forward_timeout
+            )
+        except Exception as e:
+            node_manager.mark_unhealthy(proxy_host, proxy_port)
+            return PROXY_UNREACHABLE_PREFIX + json_dumps(str(e)) + b"}\n"
+
+        if first_line:
+            body = first_line.strip()
+            if not (body.startswith(b"{") and body.endswith(b"}") and b'"status"' in body):
+                s.close()
+                node_manager.mark_unhealthy(proxy_host, proxy_port)
+                return INVALID_PROXY_RESPONSE_BYTES
+            self._put_conn(proxy_host, proxy_port, s)
+            node_manager.mark_healthy(proxy_host, proxy_port)
+            return first_line if first_line[-1] == 10 else first_line + b"\n"
+            
+        node_manager.mark_unhealthy(proxy_host, proxy_port)
+        return PROXY_UNREACHABLE_BYTES
+
+
+    def _exchange(self, host, port, payload, timeout=None):
+        """
+        Send one request line to a proxy node and read back one response line.
+
+        Parameters:
+        - host (str): Hostname or IP of the proxy node.
+        - port (int): Port number of the proxy node.
+        - payload (bytes): Newline-terminated request to send.
+        - timeout (float): Optional per-operation socket timeout in seconds; None blocks indefinitely.
+
+        Returns:
+        - tuple: (socket, bytes) with the connection used and the response line.
+          If the proxy closed the connection without answering, the socket is
+          already closed and the line is empty.
+
+        Behavior:
+        - A pooled connection that fails or returns nothing is assumed to have been
+          closed by the proxy while idle; it is discarded and the request is retried
+          on the next pooled connection, or on a fresh one once the pool is empty.
+
+        Error Handling:
+        - Socket errors on a freshly opened connection propagate to the caller.
+        - A timeout is never retried, so a slow proxy costs at most one timeout per call.
+        """
+        while True:
+            s, reused = self._get_conn(host, port, timeout)
             try:
-                s.connect((proxy_host, proxy_port))
-            except Exception as e:
-                self.node_manager.mark_unhealthy(proxy_host, proxy_port)
-                response = {
-                        "status": "PROXY_UNREACHABLE", 
-                        "data": str(e)
-                }
-                return json.dumps(response) + "\n"
-
-            f = s.makefile('r', encoding = 'utf-8', newline = "\n")
-            s.sendall(raw_request.encode('utf-8'))
+                # Pooled sockets are left at the forward timeout, so client requests skip the fcntl calls.
+                if s.gettimeout() != timeout:
+                    s.settimeout(timeout)
+                s.sendall(payload)
+                line = _recv_line(s)
+            except TimeoutError:
+                s.close()
+                raise
+            except OSError:
+                s.close()
+                if reused:
+                    continue
+                raise
             
-            first_line = f.readline()
-            if first_line:
-                j_string = first_line.strip()
-                
-                try:
-                    json.loads(j_string)
-                except Exception as e:
-                    self.node_manager.mark_unhealthy(proxy_host, proxy_port)
-                    response = {"status": "PROXY_UNREACHABLE", "data": str(e)}
-                    return json.dumps(response) + "\n"
-                self.node_manager.mark_healthy(proxy_host, proxy_port)
-                return j_string + "\n"
-        finally:
-            if f:
-                f.close()
+            if not line:
+                s.close()
+                if reused:
+                    continue
+            return s, line
+
+
+    def _get_conn(self, host, port, timeout=None):
+        """
+        Borrow a live connection to a proxy node from its keep-alive pool.
+
+        Parameters:
+        - host (str): Hostname or IP of the proxy node.
+        - port (int): Port number of the proxy node.
+        - timeout (float): Optional connect timeout in seconds for a new connection.
+
+        Returns:
+        - tuple: (socket, reused) where reused is True if the socket came from the pool.
+
+        Behavior:
+        - Pops the most recently returned socket and checks with a non-blocking peek
+          that the peer has not closed it; dead sockets are closed and skipped.
+        - On pool miss, opens a new connection with _new_conn.
+
+        Error Handling:
+        - Connection errors when opening a new socket propagate to the caller.
+        """
+        pool = self.pools[(host, port)]
+        while True:
+            try:
+                s = pool.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                # b"" means the peer closed; unsolicited bytes mean the stream is out of sync.
+                s.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                return s, True
+            except OSError:
+                pass
             s.close()
             
-        self.node_manager.mark_unhealthy(proxy_host, proxy_port)
-        response = {
-                        "status": "PROXY_UNREACHABLE", 
-                        "data": None
-        } 
-        return json.dumps(response) + "\n"
+        return self._new_conn(host, port, timeout), False
+
+
+    def _new_conn(self, host, port, timeout=None):
+        """
+        Open a new connection to a proxy node.
+
+        Parameters:
+        - host (str): Hostname or IP of the proxy node.
+        - port (int): Port number of the proxy node.
+        - timeout (float): Optional connect timeout in seconds.
+
+        Returns:
+        - socket.socket: The connected socket.
+
+        Behavior:
+        - Sets TCP_NODELAY and enables TCP keepalive (first probe after 30 idle seconds
+          where supported), so a proxy that disappears while the connection sits in the
+          pool is detected by the kernel.
+
+        Error Handling:
+        - Connection errors propagate to the caller.
+        """
+        s = socket.create_connection((host, port), timeout)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+        return s
+
+
+    def _put_conn(self, host, port, s):
+        """
+        Return a connection to the keep-alive pool of a proxy node.
+
+        Parameters:
+        - host (str): Hostname or IP of the proxy node.
+        - port (int): Port number of the proxy node.
+        - s (socket.socket): Connection that just completed a full request/response.
+
+        Side Effects:
+        - Puts the socket back to forward_timeout (the metrics poll leaves it non-blocking),
+          so the next forward_request finds it already set; the liveness peek in _get_conn
+          uses MSG_DONTWAIT and is unaffected.
+        - Closes the socket instead if the pool already holds max_keepalive connections.
+        """
+        if s.gettimeout() != self.forward_timeout:
+            s.settimeout(self.forward_timeout)
+        try:
+            self.pools[(host, port)].put_nowait(s)
+        except queue.Full:
+            s.close()
 
     def metrics_loop(self):
         """
@@ -279,9 +947,13 @@ class LoadBalancer:
 
         Behavior:
         - Runs indefinitely, waking every 2 seconds.
-        - Requests metrics from each proxy node by connecting and sending a "METRICS" request.
-        - Updates internal proxy_stats dictionary with the latest metrics.
-        - Marks proxies as healthy or unhealthy based on metrics retrieval success.
+        - Polls all proxy nodes concurrently with poll_metrics, so a round takes as long
+          as the slowest proxy rather than the sum of all of them.
+        - Marks proxies as healthy or unhealthy based on metrics retrieval success, in one
+          NodeManager batch update.
+        - Replaces proxy_stats and the load table and invalidates the cached METRICS response
+          in one acquisition of the metrics lock, so a METRICS response never mixes rounds,
+          then rebuilds the least-loaded heap.
         - Logs exceptions and continues running.
 
         Side Effects:
@@ -294,74 +966,151 @@ class LoadBalancer:
         while True:
             try:
                 time.sleep(2)
-                for proxy_host, proxy_port in self.proxy_list:
-                    metrics = self.request_metrics(proxy_host, proxy_port)
-                    if metrics:
-                        self.proxy_stats[(proxy_host, proxy_port)] = metrics
-                        self.node_manager.mark_healthy(proxy_host, proxy_port)
-                    else:
-                        self.proxy_stats[(proxy_host, proxy_port)] = None
-                        self.node_manager.mark_unhealthy(proxy_host, proxy_port)
+                results = self.poll_metrics()
+                
+                new_stats = dict(zip(self.proxy_list, results))
+                new_loads = [metrics.get("total_requests", 0) if metrics else 0 for metrics in results]
+                self.node_manager.update_health(
+                    (node, bool(metrics)) for node, metrics in new_stats.items()
+                )
+                with self._metrics_lock:
+                    self.proxy_stats = new_stats
+                    self._loads = new_loads
+                    self._metrics_cache = None
+                self._rebuild_load_heap()
             except Exception as e:
                 print(f"[MetricsLoopError] {e}")
                 continue
 
 
-    def request_metrics(self, host, port):
+    def poll_metrics(self, timeout=1.5):
         """
-        Request metrics data from a single proxy node.
+        Request metrics from every proxy node at once and collect the replies as they arrive.
 
         Parameters:
-        - host (str): Hostname or IP of the proxy node.
-        - port (int): Port number of the proxy node.
+        - timeout (float): Seconds to wait for all replies; proxies that have not answered
+          by then are reported as failed for this round.
 
         Returns:
-        - dict: Parsed metrics data if successful.
-        - None: If unable to connect or parse metrics.
+        - list: One entry per proxy, in proxy_list order: the metrics dict, or None if the
+          proxy could not be reached or sent an invalid reply.
 
         Behavior:
-        - Connects to the proxy node over TCP.
-        - Sends a "METRICS\n" request.
-        - Reads a single line response and attempts to parse it as JSON.
-        - Validates the response status and extracts data.
+        - Sends "METRICS\n" on a pooled keep-alive connection to each proxy (or a new one),
+          then waits on all of them with a single selector from this thread, instead of
+          blocking one thread per proxy.
+        - A proxy that closes its connection is noticed as soon as the EOF arrives rather
+          than when the timeout expires.
+        - A pooled connection that the proxy closed while idle is replaced by a fresh one
+          and the request is resent, as in _exchange.
+        - Connections that delivered a complete OK reply are returned to the pool; any other
+          reply closes its connection.
+        - Whatever happens, every socket still registered when the round ends is unregistered
+          and closed, so none leaks into the next round.
 
         Side Effects:
-        - Opens and closes socket connections.
+        - Opens, reuses, and closes socket connections.
 
-        Error Handling:
-        - Returns None on connection failures or invalid JSON responses.
+        Concurrency:
+        - Only called from the metrics thread, which owns self._metrics_selector.
         """
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        f = None
+        results = [None] * len(self.proxy_list)
+        selector = self._metrics_selector
         
+        for idx, (host, port) in enumerate(self.proxy_list):
+            self._send_metrics_request(idx, host, port, True)
+        
+        deadline = time.monotonic() + timeout
         try:
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                for key, _ in selector.select(remaining):
+                    s = key.fileobj
+                    idx, buf, reused = key.data
+                    host, port = self.proxy_list[idx]
+                    try:
+                        chunk = s.recv(4096)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        chunk = b""
+                    
+                    if not chunk:
+                        selector.unregister(s)
+                        s.close()
+                        if reused and not buf:
+                            self._send_metrics_request(idx, host, port, False)
+                        continue
+                    
+                    buf += chunk
+                    if chunk.find(b"\n") == -1:
+                        continue
+                    
+                    selector.unregister(s)
+                    try:
+                        res = json_loads(buf)
+                    except JSONDecodeError:
+                        s.close()
+                        continue
+                    
+                    if not (isinstance(res, dict) and res.get("status") == "OK"):
+                        s.close()
+                        continue
+                    
+                    self._put_conn(host, port, s)
+                    if "data" in res:
+                        results[idx] = res["data"]
+        finally:
+            for key in list(selector.get_map().values()):
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+        return results
+
+
+    def _send_metrics_request(self, idx, host, port, allow_reuse):
+        """
+        Send a METRICS request to one proxy node and register the socket with the metrics selector.
+
+        Parameters:
+        - idx (int): Position of the proxy in proxy_list.
+        - host (str): Hostname or IP of the proxy node.
+        - port (int): Port number of the proxy node.
+        - allow_reuse (bool): Whether a pooled connection may be used; False forces a new one.
+
+        Behavior:
+        - New connections are opened with a 1 second connect timeout, so one dead proxy
+          cannot stall a polling round for long.
+        - The socket is switched to non-blocking mode before it is registered.
+
+        Error Handling:
+        - If sending on a pooled connection fails, retries once on a new connection.
+        - If the proxy cannot be reached, nothing is registered and the proxy's result stays None.
+        """
+        while True:
             try:
-                s.connect((host, port))
-            except Exception:
-                return None
+                if allow_reuse:
+                    s, reused = self._get_conn(host, port, timeout=1.0)
+                else:
+                    s = self._new_conn(host, port, timeout=1.0)
+                    reused = False
+            except OSError:
+                return
             
-            f = s.makefile('r', encoding = 'utf-8', newline = '\n')
-            request = "METRICS\n"
-            s.sendall(request.encode('utf-8'))
+            try:
+                s.setblocking(False)
+                s.send(b"METRICS\n")
+            except OSError:
+                s.close()
+                if reused:
+                    allow_reuse = False
+                    continue
+                return
             
-            first_line = f.readline()
-            if first_line:
-                j_string = first_line.strip()
-                
-                try:
-                    res = json.loads(j_string)
-                except Exception:
-                    return None
-                
-                if res["status"] == "OK" and "data" in res:
-                    return res["data"]
-                return None
-            else:
-                return None
-        finally:
-            if f:
-                f.close()
-            s.close()
+            self._metrics_selector.register(s, selectors.EVENT_READ, (idx, bytearray(), reused))
+            return
         
 
 def main(args):
@@ -376,11 +1125,19 @@ def main(args):
     - --port (int): Port number to bind the load balancer (required).
     - --proxies (list of str): List of proxy nodes in "host:port" format.
     - --strategy (str): Load balancing strategy, either "round_robin" or "least_loaded" (default: "round_robin").
+    - --workers (int): Number of load balancer processes sharing the port (default: 1).
+    - --cache_resources (list of str): Resources whose GET responses are cached (default: none).
+    - --response_ttl (float): Seconds a cached GET response stays valid (default: 0.5).
+    - --max_keepalive (int): Idle connections kept open per proxy node (default: 100).
+    - --forward_timeout (float): Seconds to wait on a proxy before failing over (default: 5.0).
 
     Behavior:
     - Parses and validates proxy node addresses.
-    - Validates the load balancing strategy.
+    - Validates the load balancing strategy and worker count.
     - Instantiates and starts the LoadBalancer server.
+    - With more than one worker, forks that many child processes, each running its own
+      LoadBalancer bound to the same port via SO_REUSEPORT; the kernel spreads incoming
+      connections across them. Each worker keeps its own pools, metrics and counters.
 
     Side Effects:
     - Prints error messages for invalid arguments or configurations.
@@ -406,9 +1163,49 @@ def main(args):
         print(f"{args.strategy} is not a supported strategy")
         return
     
+    if args.workers < 1:
+        print("workers must be at least 1")
+        return
+    
+    if args.max_keepalive < 1:
+        print("max_keepalive must be at least 1")
+        return
+    
+    if args.response_ttl <= 0:
+        print("response_ttl must be positive")
+        return
+    
+    if args.forward_timeout <= 0:
+        print("forward_timeout must be positive")
+        return
+    
+    if args.workers > 1 and not (hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT")):
+        print("multiple workers require os.fork and SO_REUSEPORT")
+        return
+    
     print(f"Load Balancer starting on {args.host}:{args.port}")
-    load_balancer = LoadBalancer(args.host, args.port, proxy_list, args.strategy)
-    load_balancer.start_server()
+    if args.workers == 1:
+        load_balancer = LoadBalancer(
+            args.host, args.port, proxy_list, args.strategy,
+            cacheable_resources=args.cache_resources, response_ttl=args.response_ttl,
+            max_keepalive=args.max_keepalive, forward_timeout=args.forward_timeout,
+        )
+        load_balancer.start_server()
+        return
+    
+    # Workers are forked before any LoadBalancer exists, so no thread is running at fork time.
+    for _ in range(args.workers):
+        if os.fork() == 0:
+            load_balancer = LoadBalancer(
+                args.host, args.port, proxy_list, args.strategy,
+                cacheable_resources=args.cache_resources, response_ttl=args.response_ttl,
+                max_keepalive=args.max_keepalive, forward_timeout=args.forward_timeout,
+            )
+            load_balancer.start_server(reuse_port=True)
+            os._exit(0)
+    
+    for _ in range(args.workers):
+        os.wait()
 
 
 if __name__ == "__main__":
@@ -439,5 +1236,11 @@ if __name__ == "__main__":
         default="round_robin"
     )
 
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--cache_resources", type=str, nargs="*", default=[])
+    parser.add_argument("--response_ttl", type=float, default=0.5)
+    parser.add_argument("--max_keepalive", type=int, default=100)
+    parser.add_argument("--forward_timeout", type=float, default=5.0)
+
     args = parser.parse_args()
     main(args)
\ No newline at end of file
@@ -5,6 +5,7 @@ and provides thread-safe access to the current set of healthy nodes for load bal
 """
 
 import threading
+import itertools
 
 class NodeManager:
     """
@@ -15,8 +16,14 @@ class NodeManager:
     - Provide thread-safe updates and queries of node health.
     - Determine which nodes are currently healthy for routing traffic.
 
+    State Layout:
+    Node state is kept in parallel lists indexed by the node's position in proxy_list
+    (_failures and _healthy), with _index mapping (host, port) to that position.
+
     Thread Safety:
-    All methods that modify or access shared node state use a threading.Lock to ensure safe concurrent access.
+    Methods that modify node state use a threading.Lock to ensure safe concurrent access.
+    Whenever a node's health flips, an immutable snapshot of the healthy nodes is rebuilt and
+    published with a single attribute assignment, so health queries read it without locking.
 
     Failure Model:
     Nodes are marked unhealthy after exceeding a maximum number of consecutive failures (default 3).
@@ -31,22 +38,35 @@ class NodeManager:
         - proxy_list: List of tuples (host, port) representing proxy nodes.
 
         Behavior:
-        Initializes internal state tracking health and failure counts for each node.
+        Initializes the per-node failure counts and health flags, indexed by position in proxy_list.
         Assumes all nodes start as healthy with zero failures.
 
         Concurrency:
-        Initializes internal lock for thread-safe operations.
+        Initializes internal lock for thread-safe operations and the initial healthy snapshot.
         """
         self.proxy_list = proxy_list
-        self.nodes = {}
-        
-        for host, port in self.proxy_list:
-            self.nodes[(host, port)] = {
-                "healthy": True, 
-                "failures": 0
-            }
+        self._index = {node: i for i, node in enumerate(proxy_list)}
+        self._failures = [0] * len(proxy_list)
+        self._healthy = [True] * len(proxy_list)
         self.lock = threading.Lock()
         self.max_failures = 3
+        self._publish_snapshot()
+        
+    def _publish_snapshot(self):
+        """
+        Rebuild the immutable views of the currently healthy nodes.
+
+        Behavior:
+        Builds a tuple of healthy nodes in proxy_list order (falling back to all nodes when
+        none are healthy) and a frozenset for membership tests, then publishes them by
+        plain attribute assignment, which readers observe atomically.
+
+        Concurrency:
+        Assumes caller holds the lock, or is __init__.
+        """
+        healthy = tuple(itertools.compress(self.proxy_list, self._healthy))
+        self._healthy_set = frozenset(healthy)
+        self._healthy_snapshot = healthy if healthy else tuple(self.proxy_list)
         
     def mark_healthy(self, host, port):
         """
@@ -58,13 +78,21 @@ class NodeManager:
 
         Behavior:
         Sets the node's 'healthy' status to True and resets failure count to zero.
+        Republishes the healthy snapshot if the node was previously unhealthy.
 
         Concurrency:
-        Acquires internal lock to safely update shared state.
+        Acquires internal lock to safely update shared state. A node that is already
+        healthy with no recorded failures needs no update, so that common case returns
+        without taking the lock.
         """
+        i = self._index[(host, port)]
+        if self._healthy[i] and not self._failures[i]:
+            return
         with self.lock:
-            self.nodes[(host, port)]["healthy"] = True
-            self.nodes[(host, port)]["failures"] = 0
+            self._failures[i] = 0
+            if not self._healthy[i]:
+                self._healthy[i] = True
+                self._publish_snapshot()
             
     def mark_unhealthy(self, host, port):
         """
@@ -76,33 +104,65 @@ class NodeManager:
 
         Behavior:
         Increments the failure count for the node. If failure count reaches or exceeds max_failures,
-        marks the node as unhealthy.
+        marks the node as unhealthy and republishes the healthy snapshot.
 
         Concurrency:
         Acquires internal lock to safely update shared state.
         """
+        i = self._index[(host, port)]
         with self.lock:
-            self.nodes[(host, port)]["failures"] += 1
+            failures = self._failures[i] + 1
+            self._failures[i] = failures
             
-            if self.nodes[(host, port)]["failures"] >= self.max_failures:
-                self.nodes[(host, port)]["healthy"] = False
+            if self._healthy[i] and failures >= self.max_failures:
+                self._healthy[i] = False
+                self._publish_snapshot()
                 
     
+    def update_health(self, results):
+        """
+        Apply one round of health check results to all listed nodes at once.
+
+        Parameters:
+        - results: Iterable of ((host, port), ok) pairs, where ok is True if the node answered.
+
+        Behavior:
+        Applies mark_healthy semantics to nodes that answered and mark_unhealthy semantics
+        to the rest. The healthy snapshot is rebuilt at most once, after all nodes are updated.
+
+        Concurrency:
+        Acquires internal lock once for the whole batch.
+        """
+        with self.lock:
+            changed = False
+            for node, ok in results:
+                i = self._index[node]
+                if ok:
+                    self._failures[i] = 0
+                    if not self._healthy[i]:
+                        self._healthy[i] = True
+                        changed = True
+                else:
+                    failures = self._failures[i] + 1
+                    self._failures[i] = failures
+                    if self._healthy[i] and failures >= self.max_failures:
+                        self._healthy[i] = False
+                        changed = True
+            if changed:
+                self._publish_snapshot()
+    
     def get_healthy_nodes(self):
         """
         Retrieve the list of currently healthy nodes.
 
         Returns:
-        - List of (host, port) tuples representing nodes marked as healthy.
-          If no nodes are healthy, returns the full list of proxy nodes.
+        - Tuple of (host, port) tuples representing nodes marked as healthy, in proxy_list order.
+          If no nodes are healthy, returns all proxy nodes.
 
         Concurrency:
-        Acquires internal lock to safely read shared state.
+        Lock-free; returns the latest published snapshot, which is never mutated.
         """
-        with self.lock:
-            healthy_nodes = list(filter(lambda x : self.nodes[x]["healthy"], self.proxy_list))
-            
-            return healthy_nodes if healthy_nodes else self.proxy_list
+        return self._healthy_snapshot
         
     def get_all_nodes(self):
         """
@@ -129,7 +189,6 @@ class NodeManager:
         - True if the node is healthy, False otherwise.
 
         Concurrency:
-        Acquires internal lock to safely read shared state.
+        Lock-free; checks membership in the latest published snapshot.
         """
-        with self.lock:
-            return self.nodes[(host, port)]["healthy"]
\ No newline at end of file
+        return (host, port) in self._healthy_set
\ No newline at end of file
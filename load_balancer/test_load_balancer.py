@@ -0,0 +1,82 @@
+"""Tests for request forwarding in load_balancer.load_balancer.
+
+These tests verify that a proxy which accepts connections but never replies
+cannot stall the load balancer: forwards to it time out and fail over to the
+next proxy, and METRICS is still answered while every worker is busy.
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+# load_balancer imports its sibling module node_manager by bare name.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_balancer.load_balancer import LoadBalancer
+
+OK_LINE = b'{"status":"OK","data":{"title":"Article1"},"cache_hit":false,"node":0}\n'
+
+def listen():
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(("127.0.0.1", 0))
+    s.listen(64)
+    return s
+
+def serve_ok(listener):
+    def handle(conn):
+        with conn:
+            while conn.recv(4096):
+                conn.sendall(OK_LINE)
+
+    def run():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=run, daemon=True).start()
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def ask(port, request):
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as s:
+        s.sendall(request)
+        return s.recv(65536)
+
+# Test that a request to a proxy that never replies fails over, and the next request is answered.
+def test_hung_proxy_fails_over():
+    hung = listen()  # accepts connections in the kernel backlog but never replies
+    good = listen()
+    serve_ok(good)
+    lb = LoadBalancer(
+        "127.0.0.1", 0, [hung.getsockname(), good.getsockname()], "round_robin", forward_timeout=0.3
+    )
+
+    start = time.monotonic()
+    assert lb.handle_request(b"GET article/1\n") == OK_LINE
+    assert time.monotonic() - start < 2
+    assert lb.handle_request(b"GET article/1\n") == OK_LINE
+    hung.close()
+    good.close()
+
+# Test that METRICS is answered while every worker is waiting on a hung proxy.
+def test_metrics_answered_when_pool_is_busy():
+    hung = listen()
+    lb = LoadBalancer("127.0.0.1", free_port(), [hung.getsockname()], "round_robin", forward_timeout=5)
+    threading.Thread(target=lb.start_server, daemon=True).start()
+    time.sleep(0.2)
+
+    release = threading.Event()
+    for _ in range(lb.client_pool._max_workers):
+        lb.client_pool.submit(release.wait)
+
+    assert ask(lb.port, b"METRICS\n").startswith(b'{"status":"OK","data":{"strategy":"round_robin"')
+    release.set()
+    hung.close()
@@ -0,0 +1,58 @@
+"""Tests for the NodeManager class in load_balancer.node_manager.
+
+These tests verify failure counting, the unhealthy threshold, recovery,
+and the healthy-node snapshot used by the load balancer.
+"""
+
+from load_balancer.node_manager import NodeManager
+
+PROXIES = [("127.0.0.1", 8001), ("127.0.0.1", 8002), ("127.0.0.1", 8003)]
+
+# Tests that all nodes start healthy.
+def test_initially_healthy():
+    manager = NodeManager(PROXIES)
+    assert list(manager.get_healthy_nodes()) == PROXIES
+    assert manager.is_healthy("127.0.0.1", 8001)
+
+# Tests that a node stays healthy until it reaches max_failures.
+def test_unhealthy_after_max_failures():
+    manager = NodeManager(PROXIES)
+    for _ in range(manager.max_failures - 1):
+        manager.mark_unhealthy("127.0.0.1", 8002)
+    assert manager.is_healthy("127.0.0.1", 8002)
+
+    manager.mark_unhealthy("127.0.0.1", 8002)
+    assert not manager.is_healthy("127.0.0.1", 8002)
+    assert list(manager.get_healthy_nodes()) == [("127.0.0.1", 8001), ("127.0.0.1", 8003)]
+
+# Tests that marking a node healthy restores it to the healthy set.
+def test_mark_healthy_recovers_node():
+    manager = NodeManager(PROXIES)
+    for _ in range(manager.max_failures):
+        manager.mark_unhealthy("127.0.0.1", 8001)
+    manager.mark_healthy("127.0.0.1", 8001)
+
+    assert manager.is_healthy("127.0.0.1", 8001)
+    assert list(manager.get_healthy_nodes()) == PROXIES
+
+# Tests that all nodes are returned when none are healthy.
+def test_all_unhealthy_falls_back_to_all_nodes():
+    manager = NodeManager(PROXIES)
+    for node in PROXIES:
+        for _ in range(manager.max_failures):
+            manager.mark_unhealthy(*node)
+
+    assert not manager.is_healthy("127.0.0.1", 8003)
+    assert list(manager.get_healthy_nodes()) == PROXIES
+
+
+# Tests that a batch update applies failures and recoveries in one call.
+def test_update_health_batch():
+    manager = NodeManager(PROXIES)
+    for _ in range(manager.max_failures):
+        manager.update_health([(PROXIES[0], False), (PROXIES[1], True), (PROXIES[2], False)])
+    assert list(manager.get_healthy_nodes()) == [("127.0.0.1", 8002)]
+
+    manager.update_health([(PROXIES[0], True)])
+    assert manager.is_healthy("127.0.0.1", 8001)
+    assert not manager.is_healthy("127.0.0.1", 8003)
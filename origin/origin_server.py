@@ -1,12 +1,13 @@
 """Origin Server for a Distributed Proxy System.
 
 This server listens for incoming TCP connections and handles simple HTTP-like GET requests.
+Connections are served concurrently on an asyncio event loop.
 Clients send requests formatted as "METHOD /resource/key", where METHOD is currently only "GET".
 The server responds with JSON-formatted messages indicating status and data payload.
 
-The origin server serves as the authoritative source for requested resources, fetching data from
-local JSON files stored under the 'data/' directory. It supports basic error handling for unsupported
-methods and missing resources.
+The origin server serves as the authoritative source for requested resources, loaded from local
+JSON files stored under the 'data/' directory into memory at startup and reloaded when they
+change. It supports basic error handling for unsupported methods and missing resources.
 
 Request/Response Protocol:
 - Requests: "METHOD /resource/key"
@@ -14,46 +15,137 @@ Request/Response Protocol:
 
 """
 
+import os
 import socket
-import json
-import time
+import asyncio
+import argparse
 from datetime import datetime
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    import json
+
+    def json_dumps(obj):
+        """Serialize obj to compact UTF-8 JSON bytes, matching orjson's output format."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    json_loads = json.loads
+
 HOST = "127.0.0.1"
 PORT = 8000
 
-with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-    # Create a TCP socket, bind to specified host and port, and listen for incoming connections
-    s.bind((HOST, PORT))
-    s.listen(5)
-
-    # Main server loop: accept connections and process requests sequentially
-    # Behavior:
-    # - Accept a connection
-    # - Read a single request line
-    # - Parse method and URL
-    # - Validate method (only GET supported)
-    # - Fetch resource from local JSON file
-    # - Send JSON-formatted response with status and data or error message
-    # Constraints:
-    # - Single request per connection
-    # - Request format: "METHOD /resource/key"
-    # - Response ends with newline character
-    # Protocol expectations:
-    # - Client sends UTF-8 encoded requests
-    # - Server sends UTF-8 encoded JSON responses
+# Optional artificial delay in seconds before each response, to simulate a slow backend.
+FAKE_LATENCY = float(os.environ.get("ORIGIN_FAKE_LATENCY", "0"))
+
+# Whether to print a line for every connection and request; set by --verbose. Off by default,
+# since a stdout write per request would sit on the event loop's hot path.
+VERBOSE = False
+
+# Directory holding one "<resource><key>.json" file per resource, next to this module.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Seconds between checks of DATA_DIR for added, changed or removed files.
+RELOAD_INTERVAL = 2.0
+
+# Encoded OK responses keyed by "<resource><key>", and the st_mtime_ns each was built from.
+_resource_table = {}
+_resource_mtimes = {}
+
+
+def load_resource_table():
+    """
+    Build the in-memory table of encoded OK responses from the files in DATA_DIR.
+
+    Behavior:
+    - Parses each "<resource><key>.json" file and stores the complete newline-terminated
+      response bytes under "<resource><key>", so serving a GET is a single dict lookup.
+    - Files whose modification time is unchanged since the last load reuse their entry;
+      only new or changed files are read and parsed.
+    - Publishes the new table and mtimes by assignment, so readers see either the old or the
+      new table, never a partially built one. Removed files drop out of the table.
+
+    Error Handling:
+    - A file that cannot be read or parsed is logged and left out of the table.
+    """
+    global _resource_table, _resource_mtimes
+    
+    table = {}
+    mtimes = {}
+    for entry in os.scandir(DATA_DIR):
+        if not entry.name.endswith(".json") or not entry.is_file():
+            continue
+        
+        name = entry.name[:-len(".json")]
+        mtime_ns = entry.stat().st_mtime_ns
+        if _resource_mtimes.get(name) == mtime_ns:
+            table[name] = _resource_table[name]
+        else:
+            try:
+                with open(entry.path, "rb") as f:
+                    fetched_data = json_loads(f.read())
+            except (OSError, ValueError) as e:
+                print(f"There was an error loading {entry.path}: {e}")
+                continue
+            res = {
+                "status": "OK",
+                "data": fetched_data
+            }
+            table[name] = json_dumps(res) + b"\n"
+        mtimes[name] = mtime_ns
+    
+    _resource_table = table
+    _resource_mtimes = mtimes
+
+
+async def reload_resources():
+    """
+    Periodically reload the resource table so edits to DATA_DIR are picked up.
+
+    Behavior:
+    - Every RELOAD_INTERVAL seconds, rescans DATA_DIR on the default thread pool executor,
+      so the scan never stalls the event loop.
+    """
+    loop = asyncio.get_running_loop()
     while True:
+        await asyncio.sleep(RELOAD_INTERVAL)
+        try:
+            await loop.run_in_executor(None, load_resource_table)
+        except OSError as e:
+            print(f"There was an error: {e}")
 
-        conn, add = s.accept()
 
-        with conn: 
-            # Log connection with timestamp
-            print(f"Connected by: {add} at {datetime.now()}")
-            
+async def handle_connection(reader, writer):
+    """
+    Serve requests on a client connection until the client closes it.
+
+    Behavior:
+    - Reads one request line at a time and parses method and URL.
+    - Validates the method (only GET is supported).
+    - Looks the resource up in the preloaded resource table, so serving a request does
+      no file I/O.
+    - Sends a JSON-formatted response with status and data or an error message, then
+      waits for the next request, so proxies can keep connections open and reuse them.
+
+    Constraints:
+    - One response per request, in request order
+    - Request format: "METHOD /resource/key"
+    - Response ends with newline character
+
+    Protocol expectations:
+    - Client sends UTF-8 encoded requests
+    - Server sends UTF-8 encoded JSON responses
+    """
+    try:
+        # Log connection with timestamp
+        if VERBOSE:
+            print(f"Connected by: {writer.get_extra_info('peername')} at {datetime.now()}")
+        
+        while True:
             # Receive data from client
-            data = conn.recv(1024)
+            data = await reader.readline()
             if not data:
-                continue
+                return
             
             # Decode and parse request line
             data = data.decode('utf-8').strip()
@@ -66,35 +158,102 @@ with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                     "status": "WRONG_METHOD",
                     "data": f"{method} is not currently supported"
                 }
-                res_string = json.dumps(res) + "\n"
-                time.sleep(0.1)
-                conn.sendall(res_string.encode('utf-8'))
-                
+                res_bytes = json_dumps(res) + b"\n"
+                if FAKE_LATENCY:
+                    await asyncio.sleep(FAKE_LATENCY)
+                writer.write(res_bytes)
+                await writer.drain()
                 continue
                 
             # Parse resource and key from URL path
             resource, key = url.split("/", 1)
-            filepath = "../origin/data/" + resource + key + ".json"
-            print(f"{method} to file at {filepath}")
+            if VERBOSE:
+                print(f"{method} to resource {resource}{key}")
             
-            # Attempt to load requested JSON file and send response
-            try: 
-                with open(filepath) as f:
-                    fetched_data = json.load(f)
-                res = {
-                    "status": "OK",
-                    "data": fetched_data
-                }
-                res_string = json.dumps(res) + "\n"
-                time.sleep(0.1)
-                conn.sendall(res_string.encode('utf-8'))
-            except Exception as e:
-                # Handle file not found or JSON errors
+            # Look up the pre-encoded response for the requested resource
+            res_bytes = _resource_table.get(resource + key)
+            if res_bytes is None:
                 res = {
                     "status": "NOT_FOUND",
-                    "data": f"An error occured: {e}"
+                    "data": f"{resource}/{key} was not found"
                 }
-                print(f"There was an error: {e}" )
-                res_string = json.dumps(res) + "\n"
-                time.sleep(0.1)
-                conn.sendall(res_string.encode('utf-8'))
\ No newline at end of file
+                res_bytes = json_dumps(res) + b"\n"
+            
+            if FAKE_LATENCY:
+                await asyncio.sleep(FAKE_LATENCY)
+            writer.write(res_bytes)
+            await writer.drain()
+    except (OSError, ValueError) as e:
+        # Malformed request or client gone; drop this connection only
+        print(f"There was an error: {e}")
+    finally:
+        writer.close()
+
+
+async def main(host, port, reuse_port=False):
+    """
+    Load the resource table, then start the origin server and serve connections concurrently
+    on one event loop while the table is refreshed in the background.
+
+    Parameters:
+    - host (str): Host/IP to bind the origin server.
+    - port (int): Port number to bind the origin server.
+    - reuse_port (bool): Whether to set SO_REUSEPORT so several origin worker processes can
+      share the port with the kernel spreading connections across them. Off by default, so a
+      second origin started on a port already in use fails instead of silently sharing it.
+
+    The listening socket sets SO_REUSEADDR so a restart does not fail on connections left
+    in TIME_WAIT. It listens with the largest backlog the system allows. asyncio disables
+    Nagle's algorithm on every accepted connection. The reload task is cancelled when the
+    server stops.
+    """
+    load_resource_table()
+    # Keep a reference so the background task is not garbage collected, and can be stopped.
+    reloader = asyncio.create_task(reload_resources())
+    
+    try:
+        server = await asyncio.start_server(
+            handle_connection, host, port,
+            reuse_address=True, reuse_port=reuse_port, backlog=socket.SOMAXCONN,
+        )
+        async with server:
+            await server.serve_forever()
+    finally:
+        reloader.cancel()
+
+
+if __name__ == "__main__":
+    """
+    Command-line interface for starting the origin server.
+
+    Usage example:
+    python origin_server.py --host 127.0.0.1 --port 8000 [--workers 4] [--verbose]
+
+    With --workers above 1, forks that many processes, each running its own event loop bound
+    to the same port via SO_REUSEPORT. With --verbose, prints a line for every connection
+    and request.
+    """
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument("--host", type=str, default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true")
+
+    args = parser.parse_args()
+    VERBOSE = args.verbose
+    if args.workers < 1:
+        print("workers must be at least 1")
+    elif args.workers > 1 and not (hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT")):
+        print("multiple workers require os.fork and SO_REUSEPORT")
+    elif args.workers == 1:
+        asyncio.run(main(args.host, args.port))
+    else:
+        # Workers are forked before any event loop exists, so each child starts its own.
+        for _ in range(args.workers):
+            if os.fork() == 0:
+                asyncio.run(main(args.host, args.port, reuse_port=True))
+                os._exit(0)
+        
+        for _ in range(args.workers):
+            os.wait()
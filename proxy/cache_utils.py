@@ -7,23 +7,22 @@ within the proxy node.
 """
 
 import threading
-from datetime import datetime, timedelta
-from collections import defaultdict
+import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
 from typing import Any, Tuple 
 
+_MISSING = object()
+
+
 class Cache(ABC):
     """Abstract base class for cache implementations.
 
     Defines a thread-safe interface for cache operations including get, set, and size.
-    Subclasses must implement the get and set methods.
-    Thread safety is managed via a reentrant lock.
+    Subclasses must implement all three and choose their own storage and locking:
+    LRUCache guards one ordered store with one lock, while TTLCache stripes keys
+    across independently locked shards.
     """
-    
-    def __init__(self):
-        self.store = {}
-        self.lock = threading.RLock()
-        
         
     @abstractmethod
     def get(self, key) -> Tuple[Any, bool]:
@@ -33,30 +32,52 @@ class Cache(ABC):
     def set(self, key, value):
         pass
     
+    @abstractmethod
     def size(self):
-        return len(self.store)
+        pass
     
 
 class TTLCache(Cache): 
     """Thread-safe cache storing key-value pairs with expiration timestamps.
 
     This cache maintains entries with a fixed time-to-live (TTL). Entries are evicted
-    upon access if expired. Thread safety is ensured via a reentrant lock, allowing safe
-    concurrent access. Intended for use cases where cached data should automatically expire
-    after a certain duration to prevent stale data usage.
+    upon access if expired, and every sweep_every writes to a shard that shard's expired
+    entries are swept, so keys that are never read again do not linger. Keys are striped
+    across a power-of-two number of shards by hash, each with its own OrderedDict and
+    lock, so writers to different shards never contend. Every entry gets the same TTL, so
+    each shard is kept in write order, which is also expiry order, and a sweep only pops
+    from the front until it reaches a live entry. Expiry times are integer
+    time.monotonic_ns() values, so checking one is an int comparison; the clock function
+    is bound on the instance so the hot path avoids a module attribute lookup. Reads take
+    no lock and rely on single dict lookups being atomic in CPython. Intended for use
+    cases where cached data should automatically expire after a certain duration to
+    prevent stale data usage.
     """
     
-    def __init__(self, ttl):
+    sweep_every = 128
+    
+    def __init__(self, ttl, shards=16):
         """Initialize the TTLCache with a specified time-to-live for entries.
 
         Args:
             ttl (int): Time-to-live duration in seconds for each cache entry.
+            shards (int): Number of independently locked shards; must be a power of two.
+
+        Raises:
+            ValueError: If shards is not a positive power of two.
 
         Side Effects:
-            Creates an internal store dictionary and a reentrant lock for concurrency control.
+            Creates one ordered store, lock and write counter per shard.
         """
-        super().__init__()
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError(f"shards must be a positive power of two, got {shards}")
         self.ttl = ttl
+        self.ttl_ns = int(ttl * 1_000_000_000)
+        self._clock = time.monotonic_ns
+        self._mask = shards - 1
+        self._stores = [OrderedDict() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._writes_since_sweep = [0] * shards
         
     def get(self, key):
         """Retrieve the value for a given key if it exists and has not expired.
@@ -71,17 +92,22 @@ class TTLCache(Cache):
             If the key exists but is expired, it is removed from the cache.
 
         Concurrency:
-            Thread-safe; acquires a lock during access.
+            Lock-free for hits and misses; the shard lock is only taken to remove an expired
+            entry, and the entry is only removed if no concurrent set has replaced it.
         """
-        with self.lock:
-            if key not in self.store:
-                return (None, False)
-
-            value, exp = self.store[key]
-            if datetime.now() > exp:
-                self.delete(key)
-                return (None, False)
-            return (value, True)
+        shard = hash(key) & self._mask
+        store = self._stores[shard]
+        entry = store.get(key)
+        if entry is None:
+            return (None, False)
+
+        value, exp = entry
+        if self._clock() > exp:
+            with self._locks[shard]:
+                if store.get(key) is entry:
+                    del store[key]
+            return (None, False)
+        return (value, True)
     
     def set(self, key, value):
         """Set the value for a given key with the current TTL expiration.
@@ -91,14 +117,82 @@ class TTLCache(Cache):
             value: The value associated with the key.
 
         Side Effects:
-            Updates or adds the key-value pair with a new expiration timestamp.
+            Updates or adds the key-value pair with a new expiration timestamp and moves it
+            to the end of its shard. Every sweep_every writes to a shard, removes that
+            shard's expired entries.
 
         Concurrency:
-            Thread-safe; acquires a lock during modification.
+            Thread-safe; acquires the key's shard lock during modification.
         """
-        with self.lock:
-            self.store[key] = (value, datetime.now() + timedelta(seconds = self.ttl))
+        shard = hash(key) & self._mask
+        now = self._clock()
+        with self._locks[shard]:
+            store = self._stores[shard]
+            store[key] = (value, now + self.ttl_ns)
+            store.move_to_end(key)
+            self._writes_since_sweep[shard] += 1
+            if self._writes_since_sweep[shard] >= self.sweep_every:
+                self._remove_expired(shard, now)
+        
+    def size(self):
+        """Return the number of stored entries, including expired ones not yet removed.
+
+        Returns:
+            int: Sum of the shard sizes.
+
+        Concurrency:
+            Lock-free; each shard length is read atomically, so concurrent writes may or may
+            not be counted.
+        """
+        return sum(map(len, self._stores))
+        
+    def _sweep(self):
+        """Remove every expired entry from the cache.
+
+        Side Effects:
+            Deletes expired entries from every shard and resets the write counters.
+
+        Concurrency:
+            Thread-safe; acquires each shard lock in turn.
+        """
+        now = self._clock()
+        for shard, lock in enumerate(self._locks):
+            with lock:
+                self._remove_expired(shard, now)
+        
+    def _remove_expired(self, shard, now):
+        """Remove a shard's expired entries and reset its write counter.
+
+        Args:
+            shard (int): Index of the shard to sweep.
+            now (int): Current time.monotonic_ns() reading, shared with the calling write.
+
+        Concurrency:
+            Assumes caller holds the shard's lock.
+        """
+        store = self._stores[shard]
+        while store:
+            _, exp = next(iter(store.values()))
+            if now <= exp:
+                break
+            store.popitem(last=False)
+        self._writes_since_sweep[shard] = 0
         
+    def invalidate_all(self):
+        """Remove every entry from the cache in constant time.
+
+        Side Effects:
+            Replaces all shards with empty stores and resets the write counters. The old
+            stores are released to the garbage collector rather than cleared entry by entry.
+
+        Concurrency:
+            Thread-safe; the shard list is swapped with a single attribute store, so readers
+            see either the old or the new shards. A set racing with the swap may land in an
+            old shard and be discarded, as if it had happened before the invalidation.
+        """
+        self._stores = [OrderedDict() for _ in range(self._mask + 1)]
+        self._writes_since_sweep = [0] * (self._mask + 1)
+
     def delete(self, key):
         """Remove a key and its associated value from the cache if present.
 
@@ -106,33 +200,23 @@ class TTLCache(Cache):
             key: The key to remove.
 
         Side Effects:
-            Deletes the key from the internal store if it exists.
+            Deletes the key from its shard if it exists.
 
         Concurrency:
-            Thread-safe; acquires a lock during modification.
+            Thread-safe; acquires the key's shard lock during modification.
         """
-        with self.lock:
-            self.store.pop(key, None)
+        shard = hash(key) & self._mask
+        with self._locks[shard]:
+            self._stores[shard].pop(key, None)
     
 
-class ListNode:
-    """Doubly-linked list node used internally by LRUCache to maintain usage order.
-
-    Each node stores a key, a value, and pointers to the previous and next nodes in the list.
-    """
-    def __init__(self, key, value, next=None, prev=None):
-        self.key = key
-        self.value = value
-        self.next = next
-        self.prev = prev
-        
-        
 class LRUCache(Cache):
     """Thread-safe Least Recently Used (LRU) cache implementation.
 
     Maintains a fixed capacity and evicts the least recently used entries when capacity is exceeded.
-    Uses a doubly-linked list to track usage order, with most recently used items at the end.
-    Thread safety is ensured via a reentrant lock.
+    Uses an OrderedDict to track usage order, with most recently used items at the end, so
+    reordering and eviction are single C-level calls.
+    Thread safety is ensured via a plain lock; no method acquires it while already holding it.
     """
     
     def __init__(self, capacity):
@@ -142,16 +226,11 @@ class LRUCache(Cache):
             capacity (int): Maximum number of entries the cache can hold.
 
         Side Effects:
-            Initializes internal linked list with dummy head and tail nodes and sets up locking.
+            Initializes an empty ordered store and sets up locking.
         """
-        super().__init__()
         self.capacity = capacity
-        
-        self.head = ListNode("head", "")
-        self.tail = ListNode("tail", "")
-        self.head.next = self.tail
-        self.tail.prev = self.head
-        self.lock = threading.RLock()
+        self.store = OrderedDict()
+        self.lock = threading.Lock()
         
     
     def get(self, key):
@@ -164,21 +243,20 @@ class LRUCache(Cache):
             tuple: (value, True) if key exists; (None, False) otherwise.
 
         Side Effects:
-            Moves the accessed node to the end of the usage list to mark it as recently used.
+            Moves the accessed entry to the end of the store to mark it as recently used.
 
         Concurrency:
-            Thread-safe; acquires a lock during access and modification.
+            Thread-safe; misses are answered without the lock, since a single containment
+            check is atomic in CPython. Hits acquire the lock to reorder the store.
         """
+        if key not in self.store:
+            return (None, False)
         with self.lock:
-            if key not in self.store:
+            value = self.store.get(key, _MISSING)
+            if value is _MISSING:
                 return (None, False)
-            
-            node = self.store[key]
-            
-            self._delete(node)
-            self._add_to_end(node)
-            self.store[key] = node
-            return (node.value, True)
+            self.store.move_to_end(key)
+            return (value, True)
         
     def set(self, key, value):
         """Set the value for a given key, updating usage and evicting if necessary.
@@ -188,66 +266,26 @@ class LRUCache(Cache):
             value: The value associated with the key.
 
         Side Effects:
-            Updates existing node or adds a new node to the end of the usage list.
-            Evicts the least recently used node if capacity is exceeded.
+            Updates or adds the entry at the end of the store.
+            Evicts the least recently used entry if capacity is exceeded.
 
         Concurrency:
             Thread-safe; acquires a lock during modification.
         """
         with self.lock:
-            if key in self.store:
-                node = self.store[key]
-                node.value = value
-                self._delete(node)
-            else:
-                node = ListNode(key, value)
-            
-            self._add_to_end(node)
-            self.store[key] = node
-            
-            if self.size() > self.capacity:
-                node_to_delete = self.head.next
-                self._delete(node_to_delete)
-        
-    def _delete(self, node):
-        """Remove a node from the linked list and from the store.
-
-        Args:
-            node (ListNode): The node to remove.
-
-        Side Effects:
-            Updates pointers of neighboring nodes and removes the node from the cache store.
-
-        Concurrency:
-            Assumes caller holds the lock.
-        """
-        node.prev.next = node.next
-        node.next.prev = node.prev
-        
-        self.store.pop(node.key)
-        
-        node.prev = None
-        node.next = None
-        
-        
-        
-    def _add_to_end(self, node):
-        """Add a node to the end of the linked list, marking it as most recently used.
-
-        Args:
-            node (ListNode): The node to add.
+            store = self.store
+            store[key] = value
+            store.move_to_end(key)
+            if len(store) > self.capacity:
+                store.popitem(last=False)
+                
+    def size(self):
+        """Return the number of stored entries.
 
-        Side Effects:
-            Updates pointers of the tail and previous last node to include the new node.
+        Returns:
+            int: Length of the store.
 
         Concurrency:
-            Assumes caller holds the lock.
+            Lock-free; len() of a dict is a single atomic read in CPython.
         """
-        previous = self.tail.prev
-        if previous is None:
-            raise RuntimeError("List structure corrupted: tail.prev is None")
-        previous.next = node
-        node.prev = previous
-        node.next = self.tail
-        self.tail.prev = node
-        
\ No newline at end of file
+        return len(self.store)
@@ -11,11 +11,13 @@ class ProxyMetrics:
     """
     Tracks proxy server metrics such as total requests, cache hits, cache misses, and origin fetches.
 
-    These metrics provide insight into the proxy's effectiveness and performance. The class assumes
-    single-threaded usage or external synchronization if used in a multi-threaded environment, as it
-    does not implement internal thread-safety mechanisms.
+    These metrics provide insight into the proxy's effectiveness and performance. The proxy serves
+    every connection on a single asyncio event loop, so counters are plain ints incremented in place;
+    no increment can interleave with another, and reading a counter never changes it.
     """
     
+    __slots__ = ("total_requests", "cache_hits", "cache_misses", "origin_fetches", "start_time", "_start_time_iso")
+    
     def __init__(self):
         """
         Initializes a new ProxyMetrics instance with all counters set to zero and records the start time.
@@ -24,13 +26,14 @@ class ProxyMetrics:
 
         Side effects:
             - Sets counters for total requests, cache hits, cache misses, and origin fetches to zero.
-            - Records the start time of metric tracking.
+            - Records the start time of metric tracking and its ISO formatted string.
         """
         self.total_requests = 0
         self.cache_hits = 0
         self.cache_misses = 0
         self.origin_fetches = 0
         self.start_time = datetime.now()
+        self._start_time_iso = self.start_time.isoformat()
         
     def record_request(self):
         """
@@ -91,17 +94,15 @@ class ProxyMetrics:
                 - 'misses': Number of cache misses.
                 - 'origin_fetches': Number of origin fetches performed.
         """
-        total = self.cache_hits + self.cache_misses
-        if total == 0:
-            hit_rate = 0
-        else:
-            hit_rate = self.cache_hits / total
+        cache_hits = self.cache_hits
+        cache_misses = self.cache_misses
+        hit_rate = cache_hits / (cache_hits + cache_misses or 1)
         return {
-            "start_time": self.start_time.isoformat(),
+            "start_time": self._start_time_iso,
             "total_requests": self.total_requests,
             "hit_rate": hit_rate,
-            "hits": self.cache_hits,
-            "misses": self.cache_misses,
+            "hits": cache_hits,
+            "misses": cache_misses,
             "origin_fetches": self.origin_fetches
         }
         
@@ -114,4 +115,4 @@ class ProxyMetrics:
         Returns:
             int: The total number of requests recorded.
         """
-        return self.total_requests
\ No newline at end of file
+        return self.total_requests
@@ -4,18 +4,138 @@ and reports metrics on request handling. The proxy node expects requests in the
 command "METRICS" to retrieve performance statistics. Responses are JSON-encoded with status, data, cache hit info, and node port.
 """
 
-import socket 
+import os
+import re
+import socket
+import asyncio
 import cache_utils
 import metrics
-import threading
-import json
 import argparse
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    import json
+
+    def json_dumps(obj):
+        """Serialize obj to compact UTF-8 JSON bytes, matching orjson's output format."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    json_loads = json.loads
+
+# Longest origin response line accepted, in bytes; asyncio's default of 64 KiB is too small for large resources.
+ORIGIN_LINE_LIMIT = 16 * 1024 * 1024
+
+# Most idle keep-alive connections to the origin kept for reuse; extra ones are closed.
+ORIGIN_POOL_SIZE = 32
+
+# Longest request line accepted from a client, including the newline; real resource/key requests are far shorter.
+MAX_REQUEST_BYTES = 256
+
+# Head of an origin response, from "{" up to where the data value starts; the value runs to the closing "}".
+ORIGIN_HEAD_RE = re.compile(rb'\{\s*"status"\s*:\s*"([A-Z_]+)"\s*,\s*"data"\s*:\s*')
+
+# A well-formed request line once stripped: method, resource and key, split at the only space and the first "/".
+REQUEST_RE = re.compile(rb'([^ ]+) ([^ /]*)/([^ ]*)')
+
+# Opening of every OK response sent to clients; the encoded data value follows it.
+OK_RESPONSE_PREFIX = b'{"status":"OK","data":'
+
+# JSON whitespace bytes, as ints for indexing into a bytes object.
+JSON_WHITESPACE = frozenset(b" \t\r\n")
+
+# Closing byte of each delimited JSON value, keyed by its opening byte: {}, [] and "".
+JSON_CLOSERS = {0x7B: 0x7D, 0x5B: 0x5D, 0x22: 0x22}
+
+# JSON strings and the structural bytes outside them that decide where a value ends.
+JSON_TOKEN_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},]')
+
+
+def _is_single_value(span: bytes):
+    """
+    Check that a span of JSON holds exactly one value, not a value followed by more members.
+
+    Parameters:
+        span (bytes): The bytes between "data": and the closing brace of an origin response.
+
+    Behavior:
+        A span without commas is accepted straight away. Otherwise strings and brackets are
+        walked with JSON_TOKEN_RE, at C speed within each string, and the span is rejected
+        if a comma appears outside every bracket or the first value closes before the end.
+
+    Returns:
+        bool: True if no top-level comma or trailing content follows the first value.
+    """
+    if b"," not in span:
+        return True
+    
+    depth = 0
+    for token in JSON_TOKEN_RE.finditer(span):
+        byte = span[token.start()]
+        if byte == 0x22:  # a string; its contents are never structural
+            continue
+        if byte == 0x7B or byte == 0x5B:  # "{" or "["
+            depth += 1
+        elif byte == 0x7D or byte == 0x5D:  # "}" or "]"
+            depth -= 1
+            if depth == 0 and token.end() != len(span):
+                return False
+        elif depth == 0:  # a comma between top-level members
+            return False
+    return True
+
+
+def _extract_status_and_data(line: bytes):
+    """
+    Pull the status and the raw data value out of an origin response line without decoding it.
+
+    Parameters:
+        line (bytes): One origin response line, shaped {"status": "...", "data": ...}.
+
+    Behavior:
+        Matches the status member and the start of the data member with one anchored regex,
+        then takes everything up to the object's closing brace as the data value. Whitespace
+        between tokens is allowed. The data value itself is never parsed: its first and last
+        bytes are checked to match, so a line missing its closing brace is not mistaken for one
+        whose data value ends early, and _is_single_value rejects lines where other members
+        follow the data member.
+
+    Returns:
+        tuple: (status, data) as bytes, with data being the value's JSON encoding,
+               or None if the line does not have the expected shape.
+
+    Side Effects:
+        None.
+    """
+    head = ORIGIN_HEAD_RE.match(line)
+    if head is None:
+        return None
+    
+    end = len(line)
+    while end and line[end - 1] in JSON_WHITESPACE:
+        end -= 1
+    if end == 0 or line[end - 1] != 0x7D:  # "}"
+        return None
+    end -= 1
+    while end > head.end() and line[end - 1] in JSON_WHITESPACE:
+        end -= 1
+    start = head.end()
+    if end == start:
+        return None
+    closer = JSON_CLOSERS.get(line[start])
+    if closer is not None and (end - start < 2 or line[end - 1] != closer):
+        return None
+    data = line[start:end]
+    if not _is_single_value(data):
+        return None
+    return head.group(1), data
+
+
 class ProxyNode:
     """
     ProxyNode manages incoming TCP connections to serve cached data or fetch from an origin server.
     It integrates a TTL-based cache, records metrics on hits, misses, and origin fetches, and supports concurrent client handling
-    via threading. It implements a simple text-based protocol where clients send GET requests or METRICS commands,
+    on a single asyncio event loop. It implements a simple text-based protocol where clients send GET requests or METRICS commands,
     and receive JSON-formatted responses indicating status and data.
     Supports two cache types: "ttl" and "lru", using TTLCache or LRUCache accordingly.
     """
@@ -34,7 +154,9 @@ class ProxyNode:
             lru_capacity (int): Maximum number of entries for LRUCache.
 
         Side Effects:
-            Creates an internal TTLCache or LRUCache instance based on cache_type and a ProxyMetrics instance.
+            Creates an internal TTLCache or LRUCache instance based on cache_type, a ProxyMetrics instance,
+            an empty pool of idle origin connections, an empty table of in-flight origin fetches,
+            and the pre-encoded response fragments.
 
         Raises:
             None.
@@ -49,176 +171,362 @@ class ProxyNode:
         else:
             self.cache = cache_utils.LRUCache(lru_capacity)
         self.proxy_metrics = metrics.ProxyMetrics()
+        # Idle (reader, writer) pairs to the origin, most recently used last.
+        self._origin_pool = []
+        # Futures for origin fetches in progress, by cache key, resolving to (data, status).
+        self._inflight = {}
+        
+        # Closing fragments of every client response; only status and data vary per request.
+        port_bytes = str(port).encode('utf-8')
+        self._hit_suffix = b',"cache_hit":true,"node":' + port_bytes + b'}\n'
+        self._miss_suffix = b',"cache_hit":false,"node":' + port_bytes + b'}\n'
+        # Complete responses for malformed requests and the data-less origin outcomes.
+        self._malformed_request_response = self.build_response(
+            "BAD_REQUEST", "expected a request of the form 'METHOD resource/key'", False
+        )
+        self._malformed_url_response = self.build_response(
+            "BAD_REQUEST", "expected a URL of the form 'resource/key'", False
+        )
+        self._invalid_encoding_response = self.build_response(
+            "BAD_REQUEST", "resource and key must be valid UTF-8", False
+        )
+        self._origin_error_responses = {
+            status: self.build_response(status, None, False) for status in ("NOT_FOUND", "ORIGIN_FAILURE")
+        }
+        self._request_too_large_response = self.build_response(
+            "BAD_REQUEST", f"request exceeds {MAX_REQUEST_BYTES} bytes", False
+        )
         
-    def start_server(self):
+    def start_server(self, reuse_port=False):
         """
         Start the TCP server to listen for incoming client connections.
 
+        Parameters:
+            reuse_port (bool): Whether to set SO_REUSEPORT, so several worker processes can share
+                the port with the kernel spreading connections across them. Off by default, so a
+                second proxy started on a port already in use fails instead of silently splitting
+                traffic, caches and metrics with the first.
+
         Behavior:
-            Binds to the configured host and port, listens for connections,
-            and spawns a new thread to handle each connection concurrently.
-            Each connection is handled concurrently and this method blocks indefinitely.
+            Runs an asyncio event loop that binds to the configured host and port with SO_REUSEADDR
+            set, so a restart does not fail on connections left in TIME_WAIT. Listens with the largest backlog the system allows and serves
+            every connection as a coroutine on that loop instead of on a dedicated thread.
+            asyncio disables Nagle's algorithm on each accepted connection.
+            This method blocks indefinitely.
 
         Side Effects:
-            Opens a socket and runs an infinite loop accepting connections.
+            Opens a listening socket and runs the event loop forever.
 
         Raises:
             Any socket errors during bind or listen will propagate.
         """
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind((self.host, self.port))
-            s.listen(5)
-            
+        asyncio.run(self._serve(reuse_port))
+        
+    async def _serve(self, reuse_port):
+        """
+        Listen on the configured host and port and serve connections until cancelled.
+
+        Parameters:
+            reuse_port (bool): Whether to set SO_REUSEPORT on the listening socket.
+
+        Side Effects:
+            Opens a listening socket; each accepted connection runs handle_connection as a task.
+        """
+        server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, limit=MAX_REQUEST_BYTES,
+            reuse_address=True, reuse_port=reuse_port, backlog=socket.SOMAXCONN,
+        )
+        async with server:
+            await server.serve_forever()
+                
+        
+    async def handle_connection(self, reader, writer):
+        """
+        Serve requests on a client connection until the client closes it.
+
+        Parameters:
+            reader (asyncio.StreamReader): Stream the client's requests are read from.
+            writer (asyncio.StreamWriter): Stream the responses are written to.
+
+        Behavior:
+            Reads whatever the client has sent, answers every complete newline-terminated request
+            in it with handle_request, and writes all of those responses with a single write before
+            waiting for more, so pipelined requests cost one send per batch rather than one per
+            request. Clients and the load balancer can keep the connection open and reuse it.
+            A final request without a newline is answered before closing.
+            Waiting on the client or the origin yields to the event loop, so other
+            connections are served meanwhile.
+
+        Error Handling:
+            If MAX_REQUEST_BYTES arrive without a newline, the request is answered with BAD_REQUEST
+            and the connection is closed, since the rest of the line cannot be framed.
+            A client that disconnects early only ends its own connection.
+            Closes the connection once the client closes its side.
+
+        Returns:
+            None.
+        """
+        # Bound once per connection rather than looked up for every batch and request.
+        read = reader.read
+        handle_request = self.handle_request
+        pending = b""
+        try:
             while True:
+                chunk = await read(MAX_REQUEST_BYTES)
+                if not chunk:
+                    if pending:
+                        writer.write(await handle_request(pending))
+                        await writer.drain()
+                    return
                 
-                conn, add = s.accept()
-                    
-                thread1 = threading.Thread(target=self.handle_connection, args = (conn, add))
-                thread1.start()
+                requests = (pending + chunk).split(b"\n")
+                pending = requests.pop()
+                if len(pending) >= MAX_REQUEST_BYTES:
+                    writer.write(self._request_too_large_response)
+                    await writer.drain()
+                    return
+                if not requests:
+                    continue
                 
-        
-    def handle_connection(self, conn, addr):
+                writer.writelines([await handle_request(request) for request in requests])
+                await writer.drain()
+        except OSError:
+            # Client went away mid-request; nothing left to answer.
+            pass
+        finally:
+            writer.close()
+            
+    async def handle_request(self, data):
         """
-        Handle a single client connection.
+        Build the response to a single request line.
 
         Parameters:
-            conn (socket.socket): The client connection socket.
-            addr (tuple): The client address.
+            data (bytes): The raw request line, e.g. b"GET resource/key" or b"METRICS", with or
+                without its newline.
 
         Behavior:
-            Reads a request from the client, processes GET or METRICS commands,
-            serves cached data or fetches from origin, and sends JSON-formatted responses.
+            Processes GET or METRICS commands, serves cached data or fetches from origin,
+            and returns the JSON-formatted response.
+            Cache entries are the fully encoded hit response, so a hit is returned as is.
+            Concurrent misses on the same key are coalesced: only the first fetches from the
+            origin, and the rest wait for and share its result. Those followers are served from
+            the shared fetch (hit-after-wait), so they are answered with cache_hit true.
             If cache_type is LRU, recency is updated on each get/set.
 
         Side Effects:
-            Updates metrics for requests, hits, misses, and origin fetches.
+            Updates metrics for requests, hits, misses, and origin fetches. Only the request
+            that fetches from the origin counts as a miss; coalesced followers count as hits.
             May update the internal cache on origin fetch success.
 
         Error Handling:
-            Returns error responses on malformed requests or unsupported methods.
-            Closes the connection after handling.
+            Returns error responses on malformed requests or unsupported methods. Malformed
+            requests get pre-built responses, so rejecting one raises nothing and encodes nothing.
 
         Returns:
-            None.
+            bytes: The newline-terminated response line.
         """
+        # Parse on the raw bytes; the resource and key stay bytes all the way to the origin.
+        data = data.strip()
         
-        with conn:
-            data = conn.recv(1024)
-            
-            if not data:
-                return
-            
+        if data == b"METRICS":
+            return b"".join((OK_RESPONSE_PREFIX, json_dumps(self.proxy_metrics.report()), b"}\n"))
+        
+        request = REQUEST_RE.fullmatch(data)
+        if request is not None:
+            method, resource, key = request.groups()
+        else:
+            # Work out which part is malformed, for the error response.
+            method, space, url = data.partition(b" ")
+            if not space or b" " in url:
+                return self._malformed_request_response
+            if method == b"GET":
+                return self._malformed_url_response
+        
+        if method != b"GET":
+            return self.build_response(f"WRONG_METHOD: {method.decode('utf-8', 'replace')}", "", False) 
+        
+        cache_key = self.build_cache_key(resource, key)
+        if not cache_key.isascii():
+            # The origin only accepts UTF-8 requests; reject others before they reach it.
             try:
-                data = data.decode('utf-8').strip()
-                
-                if data == "METRICS":
-                    metrics_dict = self.proxy_metrics.report()
-                    res = {}
-                    res["status"] = "OK"
-                    res["data"] = metrics_dict
-                    
-                    res_string = json.dumps(res) + "\n"
-                    conn.sendall(res_string.encode('utf-8'))
-                    return
-                
-                method, url = data.split(" ")
-                
-                if method != "GET":
-                    res = self.build_response(f"WRONG_METHOD: {method}", "", False) 
-                    conn.sendall(res.encode('utf-8'))
-                    return
-                
-                resource, key = url.split("/", 1)
-                
-            except Exception as e:
-                res = self.build_response("BAD_REQUEST", str(e), False)
-                conn.sendall(res.encode('utf-8'))
-                return
-            
-            cache_key = self.build_cache_key(resource, key)
-                
-            self.proxy_metrics.record_request()
-            value, found = self.cache.get(cache_key)
-            
-            if found:
-                self.proxy_metrics.record_hit()
-                res = self.build_response("OK", value, True)
-                conn.sendall(res.encode('utf-8'))
-                return
-                
-            else:
-                self.proxy_metrics.record_miss()
-                self.proxy_metrics.record_origin_fetch()
-                value, status = self.fetch_from_origin(cache_key)
-                
-                if status == "OK":
-                    self.cache.set(cache_key, value)
-                    
-                res = self.build_response(status, value, False)
-                conn.sendall(res.encode('utf-8'))
+                cache_key.decode('utf-8')
+            except UnicodeDecodeError:
+                return self._invalid_encoding_response
+        proxy_metrics = self.proxy_metrics
+        
+        proxy_metrics.record_request()
+        value, found = self.cache.get(cache_key)
+        
+        if found:
+            # The cache holds the complete encoded hit response.
+            proxy_metrics.record_hit()
+            return value
+        
+        inflight = self._inflight
+        fetch = inflight.get(cache_key)
+        if fetch is not None:
+            # Another request is already fetching this key; share its result. The shield keeps a
+            # cancelled follower from cancelling the shared future for the leader and the others.
+            proxy_metrics.record_hit()
+            value, status = await asyncio.shield(fetch)
+            if status == "OK":
+                return self.build_data_response(value, True)
+            return self._origin_error_responses[status]
+        
+        proxy_metrics.record_miss()
+        proxy_metrics.record_origin_fetch()
+        fetch = inflight[cache_key] = asyncio.get_running_loop().create_future()
+        try:
+            value, status = await self.fetch_from_origin(cache_key)
+        except BaseException:
+            if not fetch.done():
+                fetch.set_result((None, "ORIGIN_FAILURE"))
+            raise
+        finally:
+            del inflight[cache_key]
+        
+        if status == "OK":
+            self.cache.set(cache_key, self.build_data_response(value, True))
+        if not fetch.done():
+            fetch.set_result((value, status))
+        
+        if status == "OK":
+            return self.build_data_response(value, False)
+        return self._origin_error_responses[status]
                             
         
-    def fetch_from_origin(self, cache_key: str):
+    async def fetch_from_origin(self, cache_key: bytes):
         """
         Fetch the data corresponding to cache_key from the origin server.
 
         Parameters:
-            cache_key (str): The resource/key string to request from the origin.
+            cache_key (bytes): The resource/key string to request from the origin.
 
         Behavior:
-            Opens a TCP connection to the origin server, sends a GET request,
-            reads a JSON response, and parses status and data.
+            Sends a GET request over a pooled keep-alive connection to the origin (or a new one),
+            reads a JSON response line, and extracts status and data. The connection is returned
+            to the pool after a well-formed response, so most misses skip the TCP handshake.
+            Status and the data value's raw JSON bytes are located by _extract_status_and_data
+            without decoding the payload; only lines it rejects are parsed with json_loads.
 
         Returns:
             tuple: (data, status)
-                data: The retrieved data if status is "OK", else None.
+                data: The retrieved data as encoded JSON bytes if status is "OK", else None.
                 status: One of "OK", "NOT_FOUND", or "ORIGIN_FAILURE".
                 The status may be "ORIGIN_FAILURE" when connection or parse fails.
 
         Side Effects:
-            Opens and closes a socket connection to the origin server.
+            Opens, reuses, and closes socket connections to the origin server.
 
         Error Handling:
-            Returns ("None", "ORIGIN_FAILURE") on connection errors,
-            malformed responses, or unexpected status.
+            Returns (None, "ORIGIN_FAILURE") on connection errors,
+            malformed or oversized responses, or unexpected status.
+            A connection that produced an error is closed rather than pooled.
         """
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        f = None
         try:
-            try:
-                s.connect((self.origin_host, self.origin_port))
-            except Exception as e:
+            reader, writer, first_line = await self._origin_exchange(b"GET " + cache_key + b"\n")
+        except (OSError, ValueError):
+            return (None, "ORIGIN_FAILURE")
+        
+        if not first_line.endswith(b"\n"):
+            writer.close()
+            return (None, "ORIGIN_FAILURE")
+        
+        extracted = _extract_status_and_data(first_line)
+        if extracted is not None:
+            self._release_origin_conn(reader, writer)
+            status, data = extracted
+            if status == b"OK":
+                return (data, "OK")
+            elif status == b"NOT_FOUND":
+                return (None, "NOT_FOUND")
+            else:
                 return (None, "ORIGIN_FAILURE")
+        
+        try:
+            res = json_loads(first_line)
+        except Exception as e:
+            writer.close()
+            return (None, "ORIGIN_FAILURE")
+        
+        self._release_origin_conn(reader, writer)
+        if res["status"] == "OK":
+            return (json_dumps(res["data"]), "OK")
+        elif res["status"] == "NOT_FOUND":
+            return (None, "NOT_FOUND")
+        else:
+            return (None, "ORIGIN_FAILURE")
+        
+    async def _origin_exchange(self, payload):
+        """
+        Send one request line to the origin and read back one response line.
+
+        Parameters:
+            payload (bytes): Newline-terminated request to send.
+
+        Behavior:
+            Takes the most recently used idle connection from the pool, or opens a new one
+            (asyncio disables Nagle's algorithm on it). A pooled connection that the origin
+            has closed while idle, or that fails while the request is sent, is discarded and
+            the request is retried on the next one, or on a fresh connection once the pool is
+            empty. Once the request has been sent it is never resent, so a request the origin
+            rejects by closing the connection cannot drain the pool or be repeated.
+
+        Returns:
+            tuple: (reader, writer, line) for the connection used and the response line, which
+            is empty or lacks its newline if the origin closed the connection early.
+
+        Error Handling:
+            Socket errors while sending on a fresh connection or while reading the response,
+            and ValueError for a line longer than ORIGIN_LINE_LIMIT, propagate to the caller
+            after the connection is closed.
+        """
+        pool = self._origin_pool
+        while True:
+            reused = bool(pool)
+            if reused:
+                reader, writer = pool.pop()
+                if reader.at_eof():
+                    writer.close()
+                    continue
+            else:
+                reader, writer = await asyncio.open_connection(
+                    self.origin_host, self.origin_port, limit=ORIGIN_LINE_LIMIT
+                )
             
-            f = s.makefile('r', encoding='utf-8', newline='\n')
-            request = f"GET {cache_key}\n"
-            s.sendall(request.encode('utf-8'))
+            try:
+                writer.write(payload)
+                await writer.drain()
+            except OSError:
+                writer.close()
+                if reused:
+                    continue
+                raise
             
-            first_line = f.readline()
-            if first_line:
-                j_string = first_line.strip()
-                
-                try:
-                    res = json.loads(j_string)
-                except Exception as e:
-                    return (None, "ORIGIN_FAILURE")
-                
-                if res["status"] == "OK":
-                    return (res["data"], "OK")
-                elif res["status"] == "NOT_FOUND":
-                    return (None, "NOT_FOUND")
-                else:
-                    return (None, "ORIGIN_FAILURE")
-        finally:
-            if f:
-                f.close()
-            s.close()                 
-        return (None, "ORIGIN_FAILURE")    
+            try:
+                line = await reader.readline()
+            except (OSError, ValueError):
+                writer.close()
+                raise
+            return reader, writer, line
+        
+    def _release_origin_conn(self, reader, writer):
+        """
+        Return an origin connection to the idle pool, or close it if the pool is full.
+
+        Parameters:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+        """
+        if len(self._origin_pool) < ORIGIN_POOL_SIZE:
+            self._origin_pool.append((reader, writer))
+        else:
+            writer.close()
             
         
     def build_response(self, status : str, data, cache_hit : bool):
         """
-        Build a JSON-formatted response string for client.
+        Build a JSON-formatted response for client.
 
         Parameters:
             status (str): Status string indicating request outcome.
@@ -226,37 +534,53 @@ class ProxyNode:
             cache_hit (bool): Whether the response data was served from cache.
 
         Returns:
-            str: JSON string with fields "status", "data", "cache_hit", and "node",
-                 terminated by a newline character. The node field indicates which proxy node served the request.
+            bytes: Compact JSON object with fields "status", "data", "cache_hit", and "node",
+                   terminated by a newline character. The node field indicates which proxy node served the request.
 
         Side Effects:
             None.
         """
+        return b"".join((
+            b'{"status":',
+            json_dumps(status),
+            b',"data":',
+            json_dumps(data),
+            self._hit_suffix if cache_hit else self._miss_suffix,
+        ))
         
-        response = {
-            "status" : status,
-            "data" : data,
-            "cache_hit": cache_hit,
-            "node": self.port
-        }
-        
-        return json.dumps(response) + "\n"
+    def build_data_response(self, data_json: bytes, cache_hit: bool):
+        """
+        Build an OK response for client around data that is already JSON-encoded.
+
+        Parameters:
+            data_json (bytes): The payload, encoded as JSON.
+            cache_hit (bool): Whether the response data was served from cache.
+
+        Returns:
+            bytes: The same newline-terminated JSON object as build_response("OK", data, cache_hit),
+                   joined from the pre-encoded prefix, data_json verbatim, and the pre-encoded suffix.
+
+        Side Effects:
+            None.
+        """
+        return b"".join((OK_RESPONSE_PREFIX, data_json, self._hit_suffix if cache_hit else self._miss_suffix))
         
     def build_cache_key(self, resource, key):
         """
-        Construct a cache key string from resource and key.
+        Construct a cache key from resource and key.
 
         Parameters:
-            resource (str): The resource name.
-            key (str): The key within the resource.
+            resource (bytes): The resource name, as received.
+            key (bytes): The key within the resource, as received.
 
         Returns:
-            str: Concatenated cache key in the form "resource/key".
+            bytes: Concatenated cache key in the form b"resource/key". Keys stay bytes so
+                   requests are never decoded or re-encoded on their way to the cache or origin.
 
         Side Effects:
             None.
         """
-        return resource + "/" + key
+        return resource + b"/" + key
     
 def main(args):
     """
@@ -271,10 +595,15 @@ def main(args):
             - ttl (int): Cache time-to-live in seconds.
             - cache_type (str): Cache implementation type, either "ttl" or "lru".
             - lru_capacity (int): Maximum number of entries for LRUCache.
+            - workers (int): Number of proxy processes sharing the port.
 
     Behavior:
-        Validates port arguments, prints error messages if invalid,
+        Validates port arguments and worker count, prints error messages if invalid,
         initializes and starts the ProxyNode server.
+        With more than one worker, forks that many child processes, each running its own
+        ProxyNode bound to the same port via SO_REUSEPORT; the kernel spreads incoming
+        connections across them, so hits are served on every core instead of one.
+        Each worker keeps its own cache, origin pool and metrics.
 
     Side Effects:
         Prints status messages to stdout.
@@ -298,9 +627,29 @@ def main(args):
         print("port and origin_port cannot be the same")
         return
     
+    if args.workers < 1:
+        print("workers must be at least 1")
+        return
+    
+    if args.workers > 1 and not (hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT")):
+        print("multiple workers require os.fork and SO_REUSEPORT")
+        return
+    
     print(f"Proxy node starting on {args.host}:{args.port}")
-    proxy_node = ProxyNode(args.host, args.port, args.origin_host, args.origin_port, args.cache_type, args.ttl, args.lru_capacity)
-    proxy_node.start_server()
+    if args.workers == 1:
+        proxy_node = ProxyNode(args.host, args.port, args.origin_host, args.origin_port, args.cache_type, args.ttl, args.lru_capacity)
+        proxy_node.start_server()
+        return
+    
+    # Workers are forked before any event loop exists, so each child starts its own.
+    for _ in range(args.workers):
+        if os.fork() == 0:
+            proxy_node = ProxyNode(args.host, args.port, args.origin_host, args.origin_port, args.cache_type, args.ttl, args.lru_capacity)
+            proxy_node.start_server(reuse_port=True)
+            os._exit(0)
+    
+    for _ in range(args.workers):
+        os.wait()
 
 if __name__ == "__main__":
     """
@@ -309,6 +658,7 @@ if __name__ == "__main__":
     Usage:
         python proxy_node.py --port <port> [--host <host>] [--origin_host <origin_host>]
                              [--origin_port <origin_port>] [--ttl <ttl>] [--cache_type <ttl|lru>] [--lru_capacity <int>]
+                             [--workers <int>]
 
     Required Arguments:
         --port: Port number for the proxy server (must be > 1024).
@@ -320,6 +670,7 @@ if __name__ == "__main__":
         --ttl: Cache time-to-live in seconds (default 30).
         --cache_type: Cache implementation type, either "ttl" or "lru".
         --lru_capacity: Maximum number of entries for LRUCache (default 3).
+        --workers: Number of proxy processes sharing the port (default 1).
     """
     parser = argparse.ArgumentParser()
     
@@ -364,6 +715,12 @@ if __name__ == "__main__":
         default = 3
     )
     
+    parser.add_argument(
+        "--workers",
+        type = int,
+        default = 1
+    )
+    
     args = parser.parse_args()
     
     main(args)
\ No newline at end of file
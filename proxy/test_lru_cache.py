@@ -66,4 +66,15 @@ def test_get_capacity_exceeded():
     cache.set("key2", "value2")
     cache.set("key3", "value3")
     
-    assert cache.get("key1")[0] == None
\ No newline at end of file
+    assert cache.get("key1")[0] == None
+    
+ # Tests that reading a key marks it as recently used so it survives eviction.
+def test_get_refreshes_recency():
+    cache = LRUCache(2)
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+    cache.get("key1")
+    cache.set("key3", "value3")
+    
+    assert cache.get("key1")[0] == "value1"
+    assert cache.get("key2")[0] == None
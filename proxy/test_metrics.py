@@ -0,0 +1,42 @@
+"""Tests for the ProxyMetrics class in proxy.metrics.
+
+These tests verify that recorded counters are reported accurately, including
+across repeated reads.
+"""
+
+from proxy.metrics import ProxyMetrics
+
+# Test that a fresh instance reports zero for every counter.
+def test_initial_report():
+    report = ProxyMetrics().report()
+    assert report["total_requests"] == 0
+    assert report["hits"] == 0
+    assert report["misses"] == 0
+    assert report["origin_fetches"] == 0
+    assert report["hit_rate"] == 0
+    
+# Test that recorded events are reported with the correct hit rate.
+def test_report_counts():
+    metrics = ProxyMetrics()
+    for _ in range(3):
+        metrics.record_request()
+    metrics.record_hit()
+    metrics.record_miss()
+    metrics.record_miss()
+    metrics.record_origin_fetch()
+    report = metrics.report()
+    assert report["total_requests"] == 3
+    assert report["hits"] == 1
+    assert report["misses"] == 2
+    assert report["origin_fetches"] == 1
+    assert report["hit_rate"] == 1 / 3
+    
+# Test that reading the counters does not change their reported values.
+def test_repeated_reads_are_stable():
+    metrics = ProxyMetrics()
+    metrics.record_request()
+    assert metrics.get_total_requests() == 1
+    assert metrics.get_total_requests() == 1
+    assert metrics.report()["total_requests"] == 1
+    metrics.record_request()
+    assert metrics.report()["total_requests"] == 2
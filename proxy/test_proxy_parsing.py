@@ -0,0 +1,119 @@
+"""Tests for the request and origin-response parsing in proxy.proxy_node.
+
+These tests verify how request lines are split into method, resource and key,
+how the status and raw data value are pulled out of origin response lines,
+which responses malformed requests get, and how concurrent misses are coalesced.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+# proxy_node imports its sibling modules (cache_utils, metrics) by bare name.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from proxy.proxy_node import REQUEST_RE, ProxyNode, _extract_status_and_data
+
+def handle(data):
+    node = ProxyNode("127.0.0.1", 9000, "127.0.0.1", 8000, "ttl", 30, 3)
+    return json.loads(asyncio.run(node.handle_request(data)))
+
+# Test that a well-formed request line is split into method, resource and key.
+def test_request_re_splits_request():
+    assert REQUEST_RE.fullmatch(b"GET article/1").groups() == (b"GET", b"article", b"1")
+
+# Test that only the first "/" separates the resource from the key.
+def test_request_re_key_with_slash():
+    assert REQUEST_RE.fullmatch(b"GET article/1/2").groups() == (b"GET", b"article", b"1/2")
+
+# Test that request lines with a missing slash or extra spaces do not match.
+def test_request_re_rejects_malformed():
+    assert REQUEST_RE.fullmatch(b"GET article") is None
+    assert REQUEST_RE.fullmatch(b"GET  article/1") is None
+    assert REQUEST_RE.fullmatch(b"GET article/1 x") is None
+    assert REQUEST_RE.fullmatch(b"METRICS") is None
+
+# Test that status and data are extracted from a compact origin response.
+def test_extract_compact():
+    line = b'{"status":"OK","data":{"title":"Article1","tags":["a","b"]}}\n'
+    assert _extract_status_and_data(line) == (b"OK", b'{"title":"Article1","tags":["a","b"]}')
+    assert _extract_status_and_data(b'{"status":"OK","data":"text"}\n') == (b"OK", b'"text"')
+
+# Test that whitespace between tokens and around the data value is skipped.
+def test_extract_with_whitespace():
+    line = b'{ "status" : "NOT_FOUND" , "data" :  null  }\r\n'
+    assert _extract_status_and_data(line) == (b"NOT_FOUND", b"null")
+
+# Test that a response with an empty data value is rejected.
+def test_extract_empty_data():
+    assert _extract_status_and_data(b'{"status":"OK","data":}\n') is None
+    assert _extract_status_and_data(b'{"status":"OK","data": }\n') is None
+
+# Test that a response without its closing brace is rejected.
+def test_extract_missing_brace():
+    assert _extract_status_and_data(b'{"status":"OK","data":{"a":1}\n') is None
+    assert _extract_status_and_data(b'{"status":"OK","data":1\n') is None
+
+# Test that a response with members in another order is left to the fallback parser.
+def test_extract_unexpected_shape():
+    assert _extract_status_and_data(b'{"data":1,"status":"OK"}\n') is None
+    assert _extract_status_and_data(b'[1, 2]\n') is None
+
+# Test that a response with members after the data member is left to the fallback parser.
+def test_extract_trailing_members():
+    assert _extract_status_and_data(b'{"status":"OK","data":1,"extra":2}\n') is None
+    assert _extract_status_and_data(b'{"status":"OK","data":{"a":1},"extra":{"b":2}}\n') is None
+    assert _extract_status_and_data(b'{"status":"OK","data":"x","extra":"y"}\n') is None
+
+# Test that commas inside nested values and strings do not end the data value.
+def test_extract_nested_commas():
+    line = b'{"status":"OK","data":{"a":"x,\\"y,","b":[1,{"c":2}]}}\n'
+    assert _extract_status_and_data(line) == (b"OK", b'{"a":"x,\\"y,","b":[1,{"c":2}]}')
+
+# Test that malformed requests get the matching BAD_REQUEST response.
+def test_malformed_requests():
+    assert handle(b"GET\n") == {
+        "status": "BAD_REQUEST",
+        "data": "expected a request of the form 'METHOD resource/key'",
+        "cache_hit": False,
+        "node": 9000,
+    }
+    assert handle(b"GET a b\n")["data"] == "expected a request of the form 'METHOD resource/key'"
+    assert handle(b"GET article\n")["data"] == "expected a URL of the form 'resource/key'"
+
+# Test that a method other than GET is rejected, whether or not the URL is well formed.
+def test_wrong_method():
+    assert handle(b"POST article/1\n")["status"] == "WRONG_METHOD: POST"
+    assert handle(b"POST article\n")["status"] == "WRONG_METHOD: POST"
+
+# Test that a key that is not valid UTF-8 is rejected before reaching the origin.
+def test_invalid_utf8_key():
+    assert handle(b"GET article/\xff\n") == {
+        "status": "BAD_REQUEST",
+        "data": "resource and key must be valid UTF-8",
+        "cache_hit": False,
+        "node": 9000,
+    }
+
+# Test that concurrent identical GETs make one origin fetch, count one miss, and serve the rest as hits.
+def test_concurrent_misses_share_one_fetch():
+    node = ProxyNode("127.0.0.1", 9000, "127.0.0.1", 8000, "ttl", 30, 3)
+    calls = []
+
+    async def fetch_from_origin(cache_key):
+        calls.append(cache_key)
+        await asyncio.sleep(0.05)
+        return b'{"title":"Article1"}', "OK"
+
+    async def run():
+        return await asyncio.gather(*(node.handle_request(b"GET article/1\n") for _ in range(5)))
+
+    node.fetch_from_origin = fetch_from_origin
+    responses = [json.loads(r) for r in asyncio.run(run())]
+    report = node.proxy_metrics.report()
+
+    assert len(calls) == 1
+    assert (report["origin_fetches"], report["misses"], report["hits"]) == (1, 1, 4)
+    assert [r["cache_hit"] for r in responses].count(False) == 1
+    assert all(r["data"] == {"title": "Article1"} for r in responses)
@@ -32,4 +32,63 @@ def test_get_after_ttl_expire():
     cache = TTLCache(1)
     cache.set("key1", "value1")
     time.sleep(2)
-    assert cache.get("key1")[0] == None
\ No newline at end of file
+    assert cache.get("key1")[0] == None
+    
+# Test that a sweep removes expired entries that are never read again.
+def test_sweep_removes_expired():
+    cache = TTLCache(1)
+    cache.set("key1", "value1")
+    time.sleep(1.1)
+    cache.set("key2", "value2")
+    cache._sweep()
+    assert cache.size() == 1
+    assert cache.get("key2")[0] == "value2"
+    
+# Test that writes trigger a sweep every sweep_every calls.
+def test_set_triggers_sweep():
+    cache = TTLCache(1, shards=1)
+    cache.sweep_every = 2
+    cache.set("key1", "value1")
+    time.sleep(1.1)
+    cache.set("key2", "value2")
+    assert cache.size() == 1
+    
+# Test that reading an expired key removes it from the cache.
+def test_get_removes_expired_entry():
+    cache = TTLCache(1)
+    cache.set("key1", "value1")
+    time.sleep(1.1)
+    assert cache.get("key1") == (None, False)
+    assert cache.size() == 0
+    
+# Test that rewriting a key moves it behind older entries so a sweep keeps it.
+def test_sweep_keeps_rewritten_key():
+    cache = TTLCache(1, shards=1)
+    cache.set("key1", "value1")
+    cache.set("key2", "value2")
+    time.sleep(0.6)
+    cache.set("key1", "value01")
+    time.sleep(0.6)
+    cache._sweep()
+    assert list(cache._stores[0]) == ["key1"]
+    assert cache.get("key1")[0] == "value01"
+    
+# Test that keys spread across shards are all counted and retrievable.
+def test_sharded_set_and_get():
+    cache = TTLCache(3, shards=4)
+    for i in range(32):
+        cache.set(f"key{i}", i)
+    assert cache.size() == 32
+    assert sum(1 for store in cache._stores if store) > 1
+    assert all(cache.get(f"key{i}") == (i, True) for i in range(32))
+    
+# Test that invalidating the cache drops every entry and still accepts new writes.
+def test_invalidate_all():
+    cache = TTLCache(3)
+    for i in range(10):
+        cache.set(f"key{i}", i)
+    cache.invalidate_all()
+    assert cache.size() == 0
+    assert cache.get("key1") == (None, False)
+    cache.set("key1", "value1")
+    assert cache.get("key1")[0] == "value1"